@@ -0,0 +1,235 @@
+import argparse
+import functools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import solver
+
+NODE_COUNTS = (5, 10, 100, 1000, 10000, 1000000)
+QUERY_COUNTS = (1, 100, 10000, 1000000)
+MAX_WORK = 10 ** 9
+REPEAT = 5
+REPEAT_BUDGET = 0.5
+BATCH_SETS = 1000
+STARTUP_MODULES = ("solver", "main")
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+METHODS = dict(solver.METHODS, lagrange=solver.LagrangeInterpolator,
+               barycentric=solver.BarycentricInterpolator)
+METHOD_KEYS = {'barycentric': 'lagrange'}
+
+FUNCTIONS = {
+    'lagrange': solver.interp_lagrange,
+    'barycentric': solver.interp_barycentric,
+    'newton': solver.interp_newton,
+    'gauss': solver.interp_gauss,
+    'stirling': solver.interp_stirling,
+    'bessel': solver.interp_bessel,
+    'chebyshev': solver.interp_chebyshev,
+    'spline': solver.interp_spline,
+    'spline_clamped': functools.partial(solver.interp_spline, boundary='clamped'),
+    'spline_notaknot': functools.partial(solver.interp_spline, boundary='not-a-knot'),
+    'akima': solver.interp_akima,
+    'auto': solver.interp_auto,
+}
+
+
+def make_points(n):
+    xs = np.linspace(-1.0, 1.0, n)
+    return solver.PointSet(xs, np.sin(3 * xs))
+
+
+def make_chebyshev_points(n):
+    xs = solver.chebyshev_nodes(-1.0, 1.0, n)
+    return solver.PointSet(xs, np.sin(3 * xs))
+
+
+def make_queries(points, q):
+    rng = np.random.default_rng(q)
+    return rng.uniform(points[0][0], points[-1][0], q)
+
+
+def uncached_curves(points):
+    solver.CURVE_CACHE.clear()
+    solver.FIT_CACHE.clear()
+    return solver.compute_curves(points, 0.1)
+
+
+def uncached_load(path):
+    solver.FILE_CACHE.clear()
+    return solver.load_points('file', path)
+
+
+def timed(func, repeat=REPEAT):
+    best = None
+    spent = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        spent += elapsed
+        if spent > REPEAT_BUDGET:
+            break
+    return best
+
+
+def cases(nodes, queries, max_work):
+    for n in nodes:
+        points = make_points(n)
+        if n <= solver.DIFF_TABLE_MAX and n * n <= max_work:
+            yield "compute_diff_table", n, 0, lambda: solver.compute_diff_table(points)
+
+        for key, method in METHODS.items():
+            per_query = n.bit_length() if issubclass(method, solver.PiecewiseInterpolator) else n
+            if n * per_query > max_work:
+                continue
+            pts = make_chebyshev_points(n) if key == 'chebyshev' else points
+            if solver.method_error(METHOD_KEYS.get(key, key), pts):
+                continue
+            yield f"{key}.fit", n, 0, lambda m=method, p=pts: m(p)
+            yield f"interp_{key}", n, 1, lambda f=FUNCTIONS[key], p=pts: f(p, 0.1)
+
+            interp = method(pts)
+            for q in queries:
+                if per_query * q > max_work:
+                    continue
+                xx = make_queries(points, q)
+                yield f"{key}.evaluate", n, q, lambda i=interp, x=xx: i.evaluate(x)
+
+        if n * n <= max_work:
+            yield "compute_curves", n, 0, lambda: uncached_curves(points)
+
+        if n * n * BATCH_SETS <= max_work:
+            xs = points.xs
+            ys = np.sin(np.outer(np.linspace(1.0, 3.0, BATCH_SETS), xs))
+            xx = make_queries(points, 3)
+            yield "solve_batch", n, len(xx), lambda: solver.solve_batch(xs, ys, xx)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for q in queries:
+            path = os.path.join(tmp, f"points_{q}.csv")
+            xs = np.linspace(-1.0, 1.0, max(q, 2))
+            np.savetxt(path, np.column_stack([xs, np.sin(3 * xs)]), delimiter=',')
+            yield "load_points.csv", 0, len(xs), lambda p=path: uncached_load(p)
+
+            path = os.path.join(tmp, f"points_{q}{solver.BINARY_SUFFIX}")
+            solver.save_binary(path, xs, np.sin(3 * xs))
+            yield "load_points.pts", 0, len(xs), lambda p=path: uncached_load(p)
+
+
+def import_time(module):
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+                          capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    for line in reversed(proc.stderr.splitlines()):
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1e6
+    raise RuntimeError(f"нет строки importtime для {module}")
+
+
+def startup(modules=STARTUP_MODULES, repeat=REPEAT, out=sys.stderr):
+    results = []
+    for module in modules:
+        entry = {'case': f"import {module}", 'nodes': 0, 'queries': 0}
+        try:
+            entry['seconds'] = min(import_time(module) for _ in range(repeat))
+        except Exception as e:
+            entry['error'] = f"{type(e).__name__}: {e}"
+        results.append(entry)
+        shown = f"{entry['seconds']:.6f}s" if 'seconds' in entry else entry['error']
+        print(f"{entry['case']:<22} {shown}", file=out)
+    return results
+
+
+def run(nodes, queries, max_work, out=sys.stderr):
+    results = startup(out=out)
+    with np.errstate(all='ignore'):
+        for name, n, q, func in cases(nodes, queries, max_work):
+            entry = {'case': name, 'nodes': n, 'queries': q}
+            try:
+                entry['seconds'] = timed(func)
+            except Exception as e:
+                entry['error'] = f"{type(e).__name__}: {e}"
+            results.append(entry)
+            shown = f"{entry['seconds']:.6f}s" if 'seconds' in entry else entry['error']
+            print(f"{name:<22} n={n:<6} q={q:<8} {shown}", file=out)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'system': platform.system(),
+            'time': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold, out=sys.stdout):
+    previous = {(r['case'], r['nodes'], r['queries']): r.get('seconds')
+                for r in baseline['results']}
+    regressions = 0
+    for r in report['results']:
+        key = (r['case'], r['nodes'], r['queries'])
+        old = previous.get(key)
+        new = r.get('seconds')
+        if old is None or new is None:
+            continue
+        ratio = new / old if old else float('inf')
+        mark = ""
+        if ratio > threshold:
+            mark = "  медленнее"
+            regressions += 1
+        elif ratio < 1 / threshold:
+            mark = "  быстрее"
+        print(f"{r['case']:<22} n={r['nodes']:<6} q={r['queries']:<8} "
+              f"{old:.6f}s -> {new:.6f}s  x{ratio:.2f}{mark}", file=out)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры производительности solver")
+    parser.add_argument("--nodes", type=int, nargs="+", default=NODE_COUNTS)
+    parser.add_argument("--queries", type=int, nargs="+", default=QUERY_COUNTS)
+    parser.add_argument("--max-work", type=float, default=MAX_WORK,
+                        help="пропускать случаи, где узлы×точки или узлы² больше")
+    parser.add_argument("--output", help="куда сохранить результаты (JSON)")
+    parser.add_argument("--baseline", default=BASELINE_FILE,
+                        help="файл базовых результатов для сравнения")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="записать результаты как новый базовый файл")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="порог замедления относительно базового файла")
+    args = parser.parse_args(argv)
+
+    report = run(args.nodes, args.queries, args.max_work)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    regressions = 0
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
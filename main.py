@@ -1,20 +1,36 @@
 import sys
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex
+)
 from PyQt6.QtGui import QDoubleValidator, QPalette, QColor
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QRadioButton,
-    QCheckBox, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QCheckBox, QLabel, QPushButton, QTableView,
     QFileDialog, QComboBox, QLineEdit, QSpinBox, QStackedWidget, QStatusBar,
-    QDoubleSpinBox, QAbstractItemView
+    QDoubleSpinBox, QAbstractItemView, QProgressBar
 )
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 
 import solver
 
-MAX_POINTS = 20
-FUNCTIONS = ["sin(x)", "cos(x)", "exp(x)"]
+MAX_POINTS = 2000
+LIVE_FPS = 60
+FUNCTIONS = list(solver.FUNCTION_PRESETS)
+PLOT_STYLES = {
+    'newton': ("--", "Ньютон"),
+    'gauss': ("-.", "Гаусс"),
+    'stirling': (":", "Стирлинг"),
+    'bessel': ("--", "Бессель"),
+    'lagrange': ("--", "Лагранж"),
+    'chebyshev': ("-", "Чебышёв"),
+    'spline': ("-", "Сплайн"),
+    'spline_clamped': ("--", "Сплайн (закреплённый)"),
+    'spline_notaknot': ("-.", "Сплайн (not-a-knot)"),
+    'akima': (":", "Акима"),
+    'auto': ("-", "Авто"),
+    'function': ("-", "f(x)"),
+}
+DELIMITERS = {",": ",", ";": ";", "Tab": "\t", "Пробел": None}
 
 
 def set_modern_light_theme(app):
@@ -58,7 +74,7 @@ def set_modern_light_theme(app):
             border-radius: 4px;
             padding: 4px;
         }
-        QTableWidget {
+        QTableView {
             background-color: white;
             border: 1px solid #ccc;
         }
@@ -70,11 +86,264 @@ def set_modern_light_theme(app):
     """)
 
 
+class PointsModel(QAbstractTableModel):
+    def __init__(self, rows=3):
+        super().__init__()
+        self.rows = [[None, None] for _ in range(rows)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            val = self.rows[index.row()][index.column()]
+            return "" if val is None else f"{val:.15g}"
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole:
+            return False
+        text = str(value).strip()
+        try:
+            val = float(text) if text else None
+        except ValueError:
+            return False
+        self.rows[index.row()][index.column()] = val
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return ("x", "y")[section]
+        return super().headerData(section, orientation, role)
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        self.rows[row:row] = [[None, None] for _ in range(count)]
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self.rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def set_points(self, points):
+        self.beginResetModel()
+        self.rows = [[x, y] for x, y in points]
+        self.endResetModel()
+
+    def points(self):
+        pts = []
+        for x, y in self.rows:
+            if x is None or y is None:
+                raise ValueError("Заполните все ячейки")
+            pts.append((x, y))
+        return pts
+
+
+class DiffTableModel(QAbstractTableModel):
+    def __init__(self):
+        super().__init__()
+        self.diffs = []
+        self.owned = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or not self.diffs else len(self.diffs[0])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.diffs)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        col = self.diffs[index.column()]
+        r = index.row()
+        return f"{col[r]:.6g}" if r < len(col) else None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return "y" if section == 0 else f"Δ^{section}"
+        return super().headerData(section, orientation, role)
+
+    def set_diffs(self, diffs):
+        self.beginResetModel()
+        self.diffs = list(diffs)
+        self.owned = False
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.diffs = []
+        self.owned = True
+        self.endResetModel()
+
+    def append_diagonal(self, diagonal):
+        if not self.owned:
+            self.diffs = [list(col) for col in self.diffs]
+            self.owned = True
+        n = len(diagonal)
+        root = QModelIndex()
+        self.beginInsertColumns(root, n - 1, n - 1)
+        self.diffs.append([])
+        self.endInsertColumns()
+        self.beginInsertRows(root, n - 1, n - 1)
+        for col, val in zip(self.diffs, diagonal):
+            col.append(val)
+        self.endInsertRows()
+        if n > 1:
+            self.dataChanged.emit(self.index(0, 1), self.index(n - 2, n - 1))
+
+
+class ResultsModel(QAbstractTableModel):
+    def __init__(self, headers):
+        super().__init__()
+        self.headers = list(headers)
+        self.rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row = self.rows[index.row()]
+        c = index.column()
+        return row[c] if c < len(row) else None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def add_row(self, values):
+        r = len(self.rows)
+        self.beginInsertRows(QModelIndex(), r, r)
+        self.rows.append(list(values))
+        self.endInsertRows()
+
+    def update_row(self, values):
+        for r, row in enumerate(self.rows):
+            if row[0] == values[0]:
+                self.rows[r] = list(values)
+                self.dataChanged.emit(self.index(r, 0), self.index(r, len(self.headers) - 1))
+                return
+        self.add_row(values)
+
+    def clear(self):
+        self.beginResetModel()
+        self.rows = []
+        self.endResetModel()
+
+
+class SolveCancelled(Exception):
+    pass
+
+
+class SolveSignals(QObject):
+    cleared_diffs = pyqtSignal()
+    cleared_results = pyqtSignal()
+    diffs = pyqtSignal(object)
+    result = pyqtSignal(str, str, object)
+    error = pyqtSignal(str)
+    ok = pyqtSignal(str)
+    curves = pyqtSignal(object, float, object, float, object)
+    progress = pyqtSignal(int)
+    finished = pyqtSignal()
+
+
+class SolveWorker(QRunnable):
+    def __init__(self, kind, data, methods, x_star, window, precision='float'):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = SolveSignals()
+        self.kind = kind
+        self.data = data
+        self.methods = methods
+        self.x_star = x_star
+        self.window = window
+        self.precision = precision
+        self.cancelled = False
+        self.steps = 3 + sum(1 for v in methods.values() if v)
+        self.done = 0
+
+    def cancel(self):
+        self.cancelled = True
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise SolveCancelled()
+
+    def _step(self):
+        self.check_cancelled()
+        self.done += 1
+        self.signals.progress.emit(int(100 * self.done / self.steps))
+
+    def run(self):
+        try:
+            solver.process_data(self.kind, self.data, self.methods,
+                                self.x_star, self, self.window, self.precision)
+        except SolveCancelled:
+            pass
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.error.emit(f"Ошибка вычислений: {str(e) or type(e).__name__}")
+        finally:
+            self.signals.finished.emit()
+
+    def show_error(self, msg):
+        self.check_cancelled()
+        self.signals.error.emit(msg)
+
+    def show_ok(self, msg):
+        self._step()
+        self.signals.ok.emit(msg)
+
+    def clear_diff_table(self):
+        self._step()
+        self.signals.cleared_diffs.emit()
+
+    def clear_results(self):
+        self.signals.cleared_results.emit()
+
+    def update_diff_table(self, diffs):
+        self._step()
+        self.signals.diffs.emit(diffs)
+
+    def add_result(self, method, value, details=()):
+        self._step()
+        self.signals.result.emit(method, value, list(details))
+
+    def plot(self, points, x0, window=0, methods=None, func=None):
+        curves, y0, errors = solver.compute_curves(points, x0, window, methods, func=func,
+                                                   check=self.check_cancelled)
+        self._step()
+        self.signals.curves.emit(points, x0, curves, y0, errors)
+
+
 class InterpolatorGUI(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Интерполятор")
         self.resize(1200, 700)
+        self.pool = QThreadPool.globalInstance()
+        self.worker = None
+        self.live = None
+        self.canvas = None
+        self.background = None
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.timeout.connect(self._update_live)
         self._build_ui()
 
     def _build_ui(self):
@@ -104,18 +373,27 @@ class InterpolatorGUI(QWidget):
         self.cb_gauss = QCheckBox("Гаусс")
         self.cb_stirling = QCheckBox("Стирлинг")
         self.cb_bessel = QCheckBox("Бессель")
-        for cb in (self.cb_lagr, self.cb_newton, self.cb_gauss,
-                   self.cb_stirling, self.cb_bessel):
+        self.cb_cheb = QCheckBox("Чебышёв")
+        self.cb_spline = QCheckBox("Сплайн (естественный)")
+        self.cb_spline_clamped = QCheckBox("Сплайн (закреплённый)")
+        self.cb_spline_notaknot = QCheckBox("Сплайн (not-a-knot)")
+        self.cb_akima = QCheckBox("Акима")
+        self.cb_auto = QCheckBox("Авто (выбор метода для x*)")
+        for cb in self._method_boxes():
             ml.addWidget(cb)
         btn_all = QPushButton("Выбрать всё");
         btn_all.clicked.connect(self._select_all)
         ml.addWidget(btn_all)
         left_panel.addWidget(meth_box)
 
-        self.figure = Figure(figsize=(5, 4))
-        self.ax = self.figure.add_subplot(111)
-        self.canvas = FigureCanvas(self.figure)
-        top.addWidget(self.canvas, stretch=5)
+        self.plot_host = QWidget()
+        self.plot_layout = QVBoxLayout(self.plot_host)
+        self.plot_layout.setContentsMargins(0, 0, 0, 0)
+        self.plot_placeholder = QLabel("График появится после решения")
+        self.plot_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.plot_layout.addWidget(self.plot_placeholder)
+        self.lines = {}
+        top.addWidget(self.plot_host, stretch=5)
 
         mid = QHBoxLayout();
         root.addLayout(mid, stretch=5)
@@ -135,7 +413,18 @@ class InterpolatorGUI(QWidget):
         self.sb_xstar.setRange(-1e6, 1e6)
         self.sb_xstar.setDecimals(6)
         self.sb_xstar.setValue(0.0)
+        self.sb_xstar.valueChanged.connect(self._schedule_live)
         xrow.addWidget(self.sb_xstar)
+        xrow.addWidget(QLabel("Окно k ="))
+        self.sb_window = QSpinBox()
+        self.sb_window.setRange(0, MAX_POINTS)
+        self.sb_window.setSpecialValueText("все")
+        self.sb_window.setValue(0)
+        xrow.addWidget(self.sb_window)
+        xrow.addWidget(QLabel("Точность:"))
+        self.cmb_precision = QComboBox()
+        self.cmb_precision.addItems(solver.PRECISIONS)
+        xrow.addWidget(self.cmb_precision)
         inp_layout.addLayout(xrow)
 
         tbl_layout = QVBoxLayout()
@@ -143,15 +432,20 @@ class InterpolatorGUI(QWidget):
 
         diff_box = QGroupBox("Таблица конечных разностей")
         dl = QVBoxLayout(diff_box)
-        self.tbl_diffs = QTableWidget()
+        self.diff_model = DiffTableModel()
+        self.tbl_diffs = QTableView()
+        self.tbl_diffs.setModel(self.diff_model)
         self.tbl_diffs.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tbl_diffs.horizontalHeader().setDefaultSectionSize(80)
+        self.tbl_diffs.verticalHeader().setDefaultSectionSize(22)
         dl.addWidget(self.tbl_diffs)
         tbl_layout.addWidget(diff_box)
 
         res_box = QGroupBox("Результаты")
         rl = QVBoxLayout(res_box)
-        self.tbl_results = QTableWidget(0, 2)
-        self.tbl_results.setHorizontalHeaderLabels(["Метод", "Значение"])
+        self.results_model = ResultsModel(["Метод", "Значение", *solver.STAT_COLUMNS])
+        self.tbl_results = QTableView()
+        self.tbl_results.setModel(self.results_model)
         self.tbl_results.horizontalHeader().setStretchLastSection(True)
         self.tbl_results.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         rl.addWidget(self.tbl_results)
@@ -161,6 +455,10 @@ class InterpolatorGUI(QWidget):
         root.addLayout(bottom, stretch=1)
         self.status = QStatusBar();
         bottom.addWidget(self.status, stretch=5)
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 100)
+        self.progress.setVisible(False)
+        bottom.addWidget(self.progress, stretch=1)
         btn_solve = QPushButton("Решить");
         btn_solve.clicked.connect(self._solve)
         bottom.addWidget(btn_solve, stretch=1)
@@ -168,8 +466,10 @@ class InterpolatorGUI(QWidget):
     def _page_table(self):
         w = QWidget();
         l = QVBoxLayout(w)
-        self.tbl_input = QTableWidget(3, 2)
-        self.tbl_input.setHorizontalHeaderLabels(["x", "y"])
+        self.input_model = PointsModel()
+        self.input_model.dataChanged.connect(self._table_edited)
+        self.tbl_input = QTableView()
+        self.tbl_input.setModel(self.input_model)
         l.addWidget(self.tbl_input)
         btns = QHBoxLayout();
         btns.addStretch()
@@ -194,6 +494,23 @@ class InterpolatorGUI(QWidget):
         row.addWidget(self.le_path);
         row.addWidget(btn)
         l.addLayout(row)
+        opts = QHBoxLayout()
+        self.cb_header = QCheckBox("Заголовок")
+        opts.addWidget(self.cb_header)
+        opts.addWidget(QLabel("Разделитель"))
+        self.cmb_delim = QComboBox()
+        self.cmb_delim.addItems(list(DELIMITERS))
+        opts.addWidget(self.cmb_delim)
+        opts.addWidget(QLabel("Столбцы x, y"))
+        self.sb_col_x = QSpinBox()
+        self.sb_col_x.setRange(1, 999)
+        self.sb_col_x.setValue(1)
+        self.sb_col_y = QSpinBox()
+        self.sb_col_y.setRange(1, 999)
+        self.sb_col_y.setValue(2)
+        opts.addWidget(self.sb_col_x)
+        opts.addWidget(self.sb_col_y)
+        l.addLayout(opts)
         self.pages.addWidget(w)
 
     def _page_func(self):
@@ -201,6 +518,7 @@ class InterpolatorGUI(QWidget):
         l = QVBoxLayout(w)
         row1 = QHBoxLayout()
         self.cmb_func = QComboBox();
+        self.cmb_func.setEditable(True)
         self.cmb_func.addItems(FUNCTIONS)
         row1.addWidget(QLabel("f(x) ="));
         row1.addWidget(self.cmb_func)
@@ -222,12 +540,18 @@ class InterpolatorGUI(QWidget):
         self.sb_n.setValue(5)
         row3.addWidget(QLabel("N точек"));
         row3.addWidget(self.sb_n)
+        self.cb_cheb_nodes = QCheckBox("Узлы Чебышёва")
+        row3.addWidget(self.cb_cheb_nodes)
         l.addLayout(row3)
         self.pages.addWidget(w)
 
+    def _method_boxes(self):
+        return (self.cb_lagr, self.cb_newton, self.cb_gauss, self.cb_stirling,
+                self.cb_bessel, self.cb_cheb, self.cb_spline, self.cb_spline_clamped,
+                self.cb_spline_notaknot, self.cb_akima, self.cb_auto)
+
     def _select_all(self):
-        for cb in (self.cb_lagr, self.cb_newton, self.cb_gauss,
-                   self.cb_stirling, self.cb_bessel):
+        for cb in self._method_boxes():
             cb.setChecked(True)
 
     def _switch_page(self):
@@ -239,52 +563,56 @@ class InterpolatorGUI(QWidget):
             self.pages.setCurrentIndex(2)
 
     def _add_row(self):
-        if self.tbl_input.rowCount() < MAX_POINTS:
-            self.tbl_input.insertRow(self.tbl_input.rowCount())
+        rows = self.input_model.rowCount()
+        if rows < MAX_POINTS:
+            self.input_model.insertRows(rows, 1)
         else:
             self.status.showMessage(f"Максимум {MAX_POINTS} точек", 5000)
 
     def _del_row(self):
-        rows = {idx.row() for idx in self.tbl_input.selectedIndexes()}
-        if not rows and self.tbl_input.rowCount() > 1:
-            self.tbl_input.removeRow(self.tbl_input.rowCount() - 1)
+        rows = {idx.row() for idx in self.tbl_input.selectionModel().selectedIndexes()}
+        count = self.input_model.rowCount()
+        if not rows and count > 1:
+            self.input_model.removeRows(count - 1, 1)
         elif rows:
-            self.tbl_input.removeRow(max(rows))
+            self.input_model.removeRows(max(rows), 1)
 
     def _browse(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Открыть файл", "", "Text files (*.txt *.csv)")
+        path, _ = QFileDialog.getOpenFileName(self, "Открыть файл", "", "Text files (*.txt *.csv);;Point sets (*.pts)")
         if path:
             self.le_path.setText(path)
 
     def _solve(self):
         self.status.clearMessage()
+        self.live = None
+        func = None
         try:
             if self.rb_table.isChecked():
-                pts = []
-                for r in range(self.tbl_input.rowCount()):
-                    xi = self.tbl_input.item(r, 0)
-                    yi = self.tbl_input.item(r, 1)
-                    if xi is None or yi is None:
-                        raise ValueError("Заполните все ячейки")
-                    pts.append((float(xi.text()), float(yi.text())))
                 data_kind = 'table'
-                data = pts
+                data = self.input_model.points()
             elif self.rb_file.isChecked():
                 if not self.le_path.text():
                     raise ValueError("Файл не выбран")
                 data_kind = 'file'
-                data = self.le_path.text()
+                data = {
+                    'path': self.le_path.text(),
+                    'delimiter': DELIMITERS[self.cmb_delim.currentText()],
+                    'header': self.cb_header.isChecked(),
+                    'columns': (self.sb_col_x.value() - 1, self.sb_col_y.value() - 1)
+                }
             else:
                 left = float(self.le_left.text())
                 right = float(self.le_right.text())
                 if right <= left:
                     raise ValueError("Правая граница ≤ левой")
                 data_kind = 'func'
+                func = solver.compile_expression(self.cmb_func.currentText())
                 data = {
                     'name': self.cmb_func.currentText(),
                     'left': left,
                     'right': right,
-                    'n': self.sb_n.value()
+                    'n': self.sb_n.value(),
+                    'nodes': 'chebyshev' if self.cb_cheb_nodes.isChecked() else 'uniform'
                 }
         except Exception as e:
             self.status.showMessage(f"Ошибка: {e}", 5000)
@@ -295,39 +623,107 @@ class InterpolatorGUI(QWidget):
             'newton': self.cb_newton.isChecked(),
             'gauss': self.cb_gauss.isChecked(),
             'stirling': self.cb_stirling.isChecked(),
-            'bessel': self.cb_bessel.isChecked()
+            'bessel': self.cb_bessel.isChecked(),
+            'chebyshev': self.cb_cheb.isChecked(),
+            'spline': self.cb_spline.isChecked(),
+            'spline_clamped': self.cb_spline_clamped.isChecked(),
+            'spline_notaknot': self.cb_spline_notaknot.isChecked(),
+            'akima': self.cb_akima.isChecked(),
+            'auto': self.cb_auto.isChecked(),
         }
 
-        solver.process_data(data_kind, data, methods, self.sb_xstar.value(), self)
+        if self.worker is not None:
+            self.worker.cancel()
+
+        live = {
+            'kind': data_kind,
+            'methods': methods,
+            'window': self.sb_window.value(),
+            'precision': self.cmb_precision.currentText(),
+            'func': func,
+        }
+        worker = SolveWorker(data_kind, data, methods, self.sb_xstar.value(),
+                             live['window'], live['precision'])
+        sig = worker.signals
+        sig.cleared_diffs.connect(lambda: self._from(worker, self.clear_diff_table))
+        sig.cleared_results.connect(lambda: self._from(worker, self.clear_results))
+        sig.diffs.connect(lambda d: self._from(worker, self.update_diff_table, d))
+        sig.result.connect(lambda m, v, d: self._from(worker, self.add_result, m, v, d))
+        sig.error.connect(lambda msg: self._from(worker, self.show_error, msg))
+        sig.ok.connect(lambda msg: self._from(worker, self.show_ok, msg))
+        sig.curves.connect(lambda *a: self._from(worker, self._plotted, live, *a))
+        sig.progress.connect(lambda v: self._from(worker, self.progress.setValue, v))
+        sig.finished.connect(lambda: self._finished(worker))
+
+        self.worker = worker
+        self.progress.setValue(0)
+        self.progress.setVisible(True)
+        self.pool.start(worker)
+
+    def _from(self, worker, slot, *args):
+        if worker is self.worker:
+            slot(*args)
+
+    def _finished(self, worker):
+        if worker is self.worker:
+            self.worker = None
+            self.progress.setVisible(False)
 
     def clear_diff_table(self):
-        self.tbl_diffs.clearContents()
-        self.tbl_diffs.setRowCount(0)
-        self.tbl_diffs.setColumnCount(0)
+        self.diff_model.clear()
 
     def update_diff_table(self, diffs):
-        cols = len(diffs)
-        rows = len(diffs[0]) if cols else 0
-        self.tbl_diffs.setRowCount(rows)
-        self.tbl_diffs.setColumnCount(cols)
-        headers = ["y"] + [f"Δ^{i}" for i in range(1, cols)]
-        self.tbl_diffs.setHorizontalHeaderLabels(headers)
-        for c, col in enumerate(diffs):
-            for r, val in enumerate(col):
-                it = QTableWidgetItem(f"{val:.6g}")
-                it.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                self.tbl_diffs.setItem(r, c, it)
-        self.tbl_diffs.resizeColumnsToContents()
-        self.tbl_diffs.resizeRowsToContents()
+        self.diff_model.set_diffs(diffs)
+
+    def append_diff_diagonal(self, diagonal):
+        self.diff_model.append_diagonal(diagonal)
+
+    def _table_edited(self, *args):
+        live = self.live
+        if live is None or live['kind'] != 'table' or self.worker is not None:
+            return
+        rows = self.input_model.rows
+        points = live['points']
+        n = len(points)
+        if len(rows) != n + 1 or None in rows[-1]:
+            return
+        x, y = rows[-1]
+        if x <= points.xs[-1] or [tuple(r) for r in rows[:n]] != list(points):
+            return
+        self.append_point(x, y)
+
+    def append_point(self, x, y):
+        live = self.live
+        stream = live.get('stream')
+        if stream is None:
+            stream = live['stream'] = solver.IncrementalNewtonInterpolator(live['points'])
+        n = len(stream.xs)
+        diagonal = stream.append(x, y)
+        points = solver.PointSet(stream.xs, stream.ys)
+        live['points'] = points
+        if live['window'] == 0 and live['precision'] == 'float':
+            solver.FIT_CACHE.put((solver.fingerprint(points), 'NewtonInterpolator', 0),
+                                 stream.snapshot())
+
+        if n + 1 > solver.DIFF_TABLE_MAX:
+            self.diff_model.clear()
+        elif self.diff_model.columnCount() == n:
+            self.append_diff_diagonal(diagonal)
+
+        try:
+            self.plot(points, self.sb_xstar.value(), live['window'], live['methods'],
+                      live['func'])
+        except Exception as e:
+            self.show_error(f"Ошибка вычислений: {e}")
+            return
+        self.results_model.clear()
+        self._update_live()
 
     def clear_results(self):
-        self.tbl_results.setRowCount(0)
+        self.results_model.clear()
 
-    def add_result(self, method, value):
-        r = self.tbl_results.rowCount()
-        self.tbl_results.insertRow(r)
-        self.tbl_results.setItem(r, 0, QTableWidgetItem(method))
-        self.tbl_results.setItem(r, 1, QTableWidgetItem(value))
+    def add_result(self, method, value, details=()):
+        self.results_model.add_row([method, value, *details])
 
     def show_error(self, msg):
         self.status.showMessage(f"Ошибка: {msg}", 10000)
@@ -335,35 +731,114 @@ class InterpolatorGUI(QWidget):
     def show_ok(self, msg):
         self.status.showMessage(msg, 5000)
 
-    def plot(self, points, x0):
-        xs, ys = zip(*points)
-        self.ax.clear()
-        self.ax.scatter(xs, ys, label="Узлы")
+    def plot(self, points, x0, window=0, methods=None, func=None):
+        self.draw_plot(points, x0, *solver.compute_curves(points, x0, window, methods,
+                                                          func=func))
 
-        xx = [xs[0] + i * (xs[-1] - xs[0]) / 300 for i in range(301)]
-        yy_n = [solver.interp_newton(points, x) for x in xx]
-        self.ax.plot(xx, yy_n, linestyle="--", label="Ньютон")
+    def _plotted(self, live, points, *args):
+        self.live = dict(live, points=points)
+        self.draw_plot(points, *args)
 
-        yy_g = [solver.interp_gauss(points, x) for x in xx]
-        self.ax.plot(xx, yy_g, linestyle="-.", label="Гаусс")
+    def _schedule_live(self):
+        if self.live is None or self.live_timer.isActive():
+            return
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0
+        self.live_timer.start(int(1000 / (rate if rate > 0 else LIVE_FPS)))
 
-        yy_s = [solver.interp_stirling(points, x) for x in xx]
-        self.ax.plot(xx, yy_s, linestyle=":", label="Стирлинг")
+    def _update_live(self):
+        live = self.live
+        if live is None:
+            return
+        x0 = self.sb_xstar.value()
+        y0 = None
+        try:
+            for key, y, error, stats in solver.solve(live['points'], live['methods'], x0,
+                                                     live['window'], func=live['func'],
+                                                     precision=live['precision']):
+                if error:
+                    continue
+                if y0 is None:
+                    y0 = y
+                self.results_model.update_row([solver.METHOD_LABELS[key], f"{y:.6f}",
+                                               *solver.format_stats(stats)])
+        except Exception as e:
+            self.show_error(f"Ошибка вычислений: {e}")
+            return
+        if y0 is not None:
+            self.move_marker(x0, y0)
+
+    def _on_canvas_press(self, event):
+        if event.inaxes is not self.ax or event.xdata is None or event.button is None:
+            return
+        self.sb_xstar.setValue(event.xdata)
+
+    def _on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self.lines:
+            self.ax.draw_artist(self.marker)
 
-        yy_b = [solver.interp_bessel(points, x) for x in xx]
-        self.ax.plot(xx, yy_b, linestyle="--", label="Бессель")
+    def move_marker(self, x0, y0):
+        self.marker.set_data([x0], [y0])
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.marker)
+        self.canvas.blit(self.figure.bbox)
 
-        yy_l = [solver.interp_lagrange(points, x) for x in xx]
-        self.ax.plot(xx, yy_l, linestyle="--", label="Лагранж")
+    def _ensure_canvas(self):
+        if self.canvas is not None:
+            return
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
 
-        y0 = solver.interp_newton(points, x0)
-        self.ax.scatter([x0], [y0], marker="x", s=100, label=f"x*={x0:.4g}")
+        self.figure = Figure(figsize=(5, 4))
+        self.ax = self.figure.add_subplot(111)
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('button_press_event', self._on_canvas_press)
+        self.canvas.mpl_connect('motion_notify_event', self._on_canvas_press)
+        self.plot_layout.removeWidget(self.plot_placeholder)
+        self.plot_placeholder.deleteLater()
+        self.plot_layout.addWidget(self.canvas)
+        self._init_plot()
+
+    def _init_plot(self):
+        self.node_line, = self.ax.plot([], [], "o", label="Узлы")
+        self.lines = {}
+        for key, (linestyle, label) in PLOT_STYLES.items():
+            self.lines[key], = self.ax.plot([], [], linestyle=linestyle, label=label)
+        self.marker, = self.ax.plot([], [], "x", markersize=10, markeredgewidth=2,
+                                    label="x*", animated=True)
         self.ax.set_xlabel("x")
         self.ax.set_ylabel("y")
         self.ax.set_title("Интерполяция")
-        self.ax.legend()
         self.ax.grid(True)
-        self.canvas.draw()
+
+    def draw_plot(self, points, x0, curves, y0, errors=None):
+        self._ensure_canvas()
+        points = solver.PointSet.from_points(points)
+        self.node_line.set_data(points.xs, points.ys)
+
+        errors = errors or {}
+        for key, line in self.lines.items():
+            if key in curves:
+                line.set_data(*curves[key])
+                line.set_visible(True)
+                label = PLOT_STYLES[key][1]
+                if key in errors:
+                    label = f"{label} (ошибка {errors[key]:.2g})"
+                line.set_label(label)
+            else:
+                line.set_data([], [])
+                line.set_visible(False)
+
+        self.marker.set_data([x0], [y0])
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view()
+        self.ax.legend(handles=[l for l in self.ax.lines if l.get_visible()])
+        self.canvas.draw_idle()
 
 
 def main():
@@ -1,211 +1,1776 @@
-import csv
+import ast
+import contextlib
+import copy
+import functools
+import hashlib
+import importlib
+import itertools
 import math
-from functools import reduce
+import os
+import re
+import struct
+import sys
+import threading
+import time
+import warnings
+from collections import OrderedDict
 
-FUNCTION_MAP = {
-    "sin(x)": math.sin,
-    "cos(x)": math.cos,
-    "exp(x)": math.exp,
+
+class _LazyModule:
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+np = _LazyModule('numpy')
+
+FUNCTION_PRESETS = ("sin(x)", "cos(x)", "exp(x)", "exp(-x**2)*sin(5*x)", "1/(1+25*x**2)")
+
+EXPRESSION_NAMES = {
+    'sin': 'sin', 'cos': 'cos', 'tan': 'tan',
+    'asin': 'arcsin', 'acos': 'arccos', 'atan': 'arctan',
+    'arcsin': 'arcsin', 'arccos': 'arccos', 'arctan': 'arctan',
+    'sinh': 'sinh', 'cosh': 'cosh', 'tanh': 'tanh',
+    'exp': 'exp', 'log': 'log', 'ln': 'log', 'log2': 'log2', 'log10': 'log10',
+    'sqrt': 'sqrt', 'abs': 'abs', 'sign': 'sign',
+    'floor': 'floor', 'ceil': 'ceil',
+    'pi': 'pi', 'e': 'e',
 }
+EXPRESSION_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.USub, ast.UAdd,
+)
+
+ARRAY_CHUNK = 1 << 20
+WINDOW_CACHE_SIZE = 1024
+FIT_CACHE_SIZE = 64
+CURVE_CACHE_SIZE = 64
+FILE_CACHE_SIZE = 8
+EXPRESSION_CACHE_SIZE = 128
+CSV_CHUNK_ROWS = 1 << 16
+
+BINARY_MAGIC = b"IPTS"
+BINARY_VERSION = 1
+BINARY_SUFFIX = ".pts"
+BINARY_HEADER = struct.Struct("<4sHB1x8sQdd")
+BINARY_HEADER_SIZE = 64
+FLAG_SORTED = 1
+FLAG_EQUISPACED = 2
+
+ADAPTIVE_INITIAL = 33
+ADAPTIVE_MAX = 2001
+ADAPTIVE_TOL = 1e-3
+PARALLEL_CHUNK = 1 << 18
+
+AUTO_EDGE = 0.25
+ESTIMATE_QUERIES = 1000
+POLY_MAX_NODES = 5000
+DIFF_TABLE_MAX = POLY_MAX_NODES
+
+PRECISIONS = ('float', 'fraction', 'decimal', 'mpmath')
+PRECISION_DIGITS = 50
+
+
+class LRUCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.data)
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key in self.data:
+                self.data.move_to_end(key)
+                self.hits += 1
+                return self.data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def get_or_create(self, key, factory):
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        return {'size': len(self.data), 'maxsize': self.maxsize,
+                'hits': self.hits, 'misses': self.misses}
+
+
+FIT_CACHE = LRUCache(FIT_CACHE_SIZE)
+CURVE_CACHE = LRUCache(CURVE_CACHE_SIZE)
+FILE_CACHE = LRUCache(FILE_CACHE_SIZE)
+EXPRESSION_CACHE = LRUCache(EXPRESSION_CACHE_SIZE)
+
+
+def cache_stats():
+    return {'fit': FIT_CACHE.stats(), 'curve': CURVE_CACHE.stats(),
+            'file': FILE_CACHE.stats(), 'expression': EXPRESSION_CACHE.stats()}
+
+
+def clear_caches():
+    FIT_CACHE.clear()
+    CURVE_CACHE.clear()
+    FILE_CACHE.clear()
+    EXPRESSION_CACHE.clear()
+
+
+def fingerprint(points):
+    points = PointSet.from_points(points)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((points.xs.shape, points.ys.shape)).encode())
+    digest.update(points.xs)
+    digest.update(points.ys)
+    return digest.hexdigest()
+
+
+class _FloatConstants(ast.NodeTransformer):
+    def visit_Constant(self, node):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"недопустимая константа: {node.value!r}")
+        return ast.copy_location(ast.Constant(float(node.value)), node)
+
+
+def compile_expression(text):
+    return EXPRESSION_CACHE.get_or_create(text.strip(), lambda: _compile_expression(text))
+
+
+def _compile_expression(text):
+    try:
+        tree = ast.parse(text.strip().replace('^', '**'), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"ошибка в выражении: {e.msg}") from None
+    names = {name: getattr(np, attr) for name, attr in EXPRESSION_NAMES.items()}
+    for node in ast.walk(tree):
+        if not isinstance(node, EXPRESSION_NODES):
+            raise ValueError(f"недопустимая конструкция: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id != 'x' and node.id not in names:
+            raise ValueError(f"неизвестное имя: {node.id}")
+        if isinstance(node, ast.Call):
+            if (not isinstance(node.func, ast.Name) or node.keywords
+                    or not callable(names.get(node.func.id))):
+                raise ValueError("недопустимый вызов функции")
+    tree = ast.fix_missing_locations(_FloatConstants().visit(tree))
+    code = compile(tree, "<выражение>", "eval")
+    namespace = {'__builtins__': {}, **names}
+
+    def func(x):
+        xx = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            result = eval(code, namespace, {'x': xx})
+        return np.broadcast_to(np.asarray(result, dtype=float), xx.shape).copy()
+
+    func.expression = text.strip()
+    return func
+
+
+class PointSet:
+    __slots__ = ('xs', 'ys', 'equispaced')
+
+    def __init__(self, xs, ys, equispaced=None):
+        self.xs = np.ascontiguousarray(xs, dtype=float)
+        self.ys = np.ascontiguousarray(ys, dtype=float)
+        if self.xs.ndim != 1 or len(self.ys) != len(self.xs):
+            raise ValueError("x и y должны иметь одинаковую длину")
+        self.equispaced = equispaced
+
+    @classmethod
+    def from_points(cls, points):
+        if isinstance(points, cls):
+            return points
+        points = list(points)
+        if not points:
+            return cls(np.empty(0), np.empty(0))
+        xs, ys = zip(*points)
+        return cls(xs, ys)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __iter__(self):
+        return zip(self.xs.tolist(), self.column())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            xs = self.xs[index]
+            return PointSet(xs, self.ys[index], True if self.equispaced and len(xs) > 1 else None)
+        y = self.ys[index]
+        return float(self.xs[index]), (y.item() if y.ndim == 0 else y)
+
+    def column(self):
+        return self.ys.tolist() if self.ys.ndim == 1 else list(self.ys)
+
+    def is_sorted(self):
+        return bool(np.all(self.xs[1:] >= self.xs[:-1]))
+
+    def is_equispaced(self):
+        if self.equispaced is None:
+            self.equispaced = is_equispaced(self.xs)
+        return self.equispaced
+
+    def sorted(self):
+        if self.is_sorted():
+            return self
+        order = np.argsort(self.xs, kind='stable')
+        return PointSet(self.xs[order], self.ys[order], self.equispaced)
+
+
+class DiffTable:
+    __slots__ = ('n', 'data')
+
+    def __init__(self, ys):
+        ys = np.asarray(ys)
+        if ys.dtype != object:
+            ys = ys.astype(float, copy=False)
+        n = len(ys)
+        self.n = n
+        self.data = np.empty((n * (n + 1) // 2,) + ys.shape[1:], dtype=ys.dtype)
+        if n:
+            self.data[:n] = ys
+        with np.errstate(over='ignore', invalid='ignore'):
+            for k in range(1, n):
+                prev = self[k - 1]
+                np.subtract(prev[1:], prev[:-1], out=self[k])
+
+    def offset(self, k):
+        return k * self.n - k * (k - 1) // 2
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self.n
+        if not 0 <= k < self.n:
+            raise IndexError("нет такого порядка разностей")
+        start = self.offset(k)
+        return self.data[start:start + self.n - k]
+
+    def __iter__(self):
+        return (self[k] for k in range(self.n))
+
+    def entry(self, k, i):
+        if not 0 <= i < self.n - k:
+            raise IndexError("нет такой разности")
+        value = self.data[self.offset(k) + i]
+        return value.item() if isinstance(value, np.generic) else value
 
 
 def compute_diff_table(points):
-    n = len(points)
-    table = [[y for _, y in points]]
-    for level in range(1, n):
-        prev = table[-1]
-        curr = [prev[i + 1] - prev[i] for i in range(len(prev) - 1)]
-        table.append(curr)
-    return table
+    if isinstance(points, PointSet):
+        return DiffTable(points.ys)
+    return DiffTable([y for _, y in points])
 
 
-def interp_lagrange(points, x0):
-    result = 0.0
-    for i, (xi, yi) in enumerate(points):
-        term = yi
-        for j, (xj, _) in enumerate(points):
-            if i != j:
-                term *= (x0 - xj) / (xi - xj)
-        result += term
-    return result
+class Interpolator:
+    has_remainder = False
 
+    def __init__(self, points):
+        if isinstance(points, PointSet):
+            self.xs = points.xs.tolist()
+            self.ys = points.column()
+            return
+        self.xs = [p[0] for p in points]
+        self.ys = [p[1] for p in points]
 
-def interp_newton(points, x0):
-    n = len(points)
-    xs = [p[0] for p in points]
+    def evaluate(self, x):
+        if np.ndim(x) == 0:
+            return self._evaluate_point(x)
+        xx = np.asarray(x, dtype=float)
+        return self._evaluate_array(xx.ravel()).reshape(xx.shape)
 
-    dd = [[p[1]] for p in points]
-    for level in range(1, n):
-        for i in range(n - level):
-            num = dd[i + 1][level - 1] - dd[i][level - 1]
-            den = xs[i + level] - xs[i]
-            dd[i].append(num / den)
+    def _evaluate_point(self, x):
+        raise NotImplementedError
 
-    result = dd[0][0]
-    prod = 1.0
-    for level in range(1, n):
-        prod *= (x0 - xs[level - 1])
-        result += dd[0][level] * prod
-    return result
+    def _evaluate_array(self, xx):
+        return np.array([self._evaluate_point(x) for x in xx.tolist()])
 
+    def error_estimate(self, x):
+        if not self.has_remainder:
+            return None
+        if np.ndim(x) == 0:
+            return abs(self._last_term(x))
+        xx = np.ravel(x)
+        if len(xx) > ESTIMATE_QUERIES:
+            xx = xx[np.linspace(0, len(xx) - 1, ESTIMATE_QUERIES).astype(int)]
+        return max(abs(self._last_term(v)) for v in xx.tolist())
 
-def interp_gauss(points, x0):
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    n = len(xs) - 1
-    mid = n // 2
+    def _last_term(self, x):
+        raise NotImplementedError
 
-    fin_diffs = [ys[:]]
-    for k in range(1, n + 1):
-        prev = fin_diffs[-1]
-        fin_diffs.append([prev[i + 1] - prev[i] for i in range(len(prev) - 1)])
+    def eval_ops(self):
+        return 0
 
-    h = xs[1] - xs[0]
+    def __call__(self, x):
+        return self.evaluate(x)
 
-    shifts = [0, -1, 1, -2, 2, -3, 3, -4, 4][:n + 1]
 
-    def branch_positive(x):
-        t = (x - xs[mid]) / h
-        terms = []
-        for k in range(1, n + 1):
-            prod = reduce(lambda a, b: a * b,
-                          [(t + shifts[j]) for j in range(k)], 1.0)
-            delta = fin_diffs[k][len(fin_diffs[k]) // 2]
-            terms.append(prod * delta / math.factorial(k))
-        return ys[mid] + sum(terms)
-
-    def branch_negative(x):
-        t = (x - xs[mid]) / h
-        terms = []
+class LagrangeInterpolator(Interpolator):
+    def __init__(self, points):
+        super().__init__(points)
+        xs = self.xs
+        self.scales = []
+        for i, xi in enumerate(xs):
+            scale = self.ys[i]
+            for j, xj in enumerate(xs):
+                if i != j:
+                    scale = scale / (xi - xj)
+            self.scales.append(scale)
+
+    def _evaluate_point(self, x):
+        xs = self.xs
+        result = 0
+        for i, scale in enumerate(self.scales):
+            term = scale
+            for j, xj in enumerate(xs):
+                if i != j:
+                    term = term * (x - xj)
+            result += term
+        return result
+
+    def _evaluate_array(self, xx):
+        xs = np.asarray(self.xs)
+        scales = np.asarray(self.scales)
+        out = np.empty_like(xx)
+        chunk = max(1, ARRAY_CHUNK // max(len(xs), 1))
+        for start in range(0, len(xx), chunk):
+            d = xx[start:start + chunk, None] - xs
+            left = np.ones_like(d)
+            right = np.ones_like(d)
+            np.cumprod(d[:, :-1], axis=1, out=left[:, 1:])
+            right[:, :-1] = np.cumprod(d[:, :0:-1], axis=1)[:, ::-1]
+            left *= right
+            out[start:start + chunk] = left @ scales
+        return out
+
+    def _last_term(self, x):
+        term = sum(self.scales)
+        for xj in self.xs[:-1]:
+            term *= (x - xj)
+        return term
+
+    def eval_ops(self):
+        n = len(self.xs)
+        return 2 * n * n
+
+
+class BarycentricInterpolator(Interpolator):
+    def __init__(self, points):
+        super().__init__(points)
+        xs = np.asarray(self.xs, dtype=float)
+        n = len(xs)
+        logs = np.zeros(n)
+        signs = np.ones(n)
+        chunk = max(1, ARRAY_CHUNK // max(n, 1))
+        for start in range(0, n, chunk):
+            d = xs[start:start + chunk, None] - xs
+            rows = np.arange(len(d))
+            d[rows, start + rows] = 1.0
+            logs[start:start + chunk] = np.log(np.abs(d)).sum(axis=1)
+            signs[start:start + chunk] = np.where((d < 0).sum(axis=1) % 2, -1.0, 1.0)
+        self.log_ref = float(logs.min()) if n else 0.0
+        self.weights = (signs * np.exp(self.log_ref - logs)).tolist()
+
+    def _renormalize(self):
+        peak = max((abs(w) for w in self.weights), default=0.0)
+        if peak and not 1e-100 < peak < 1e100:
+            self.weights = [w / peak for w in self.weights]
+            self.log_ref -= math.log(peak)
+
+    def add_node(self, x, y):
+        if x in self.xs:
+            raise ValueError(f"Узел x={x} уже есть")
+        log_new = 0.0
+        sign = 1.0
+        weights = []
+        for xi, wi in zip(self.xs, self.weights):
+            d = x - xi
+            weights.append(wi / -d)
+            log_new += math.log(abs(d))
+            if d < 0:
+                sign = -sign
+        weights.append(sign * math.exp(self.log_ref - log_new))
+        self.xs = self.xs + [x]
+        self.ys = self.ys + [y]
+        self.weights = weights
+        self._renormalize()
+
+    def remove_node(self, index):
+        xk = self.xs[index]
+        self.xs = self.xs[:index] + self.xs[index + 1:]
+        self.ys = self.ys[:index] + self.ys[index + 1:]
+        weights = self.weights[:index] + self.weights[index + 1:]
+        self.weights = [w * (xi - xk) for xi, w in zip(self.xs, weights)]
+        self._renormalize()
+
+    def _evaluate_point(self, x):
+        num = 0.0
+        den = 0.0
+        for xi, yi, wi in zip(self.xs, self.ys, self.weights):
+            d = x - xi
+            if d == 0:
+                return yi
+            c = wi / d
+            num += c * yi
+            den += c
+        return num / den
+
+    def _evaluate_array(self, xx):
+        xs = np.asarray(self.xs)
+        ys = np.asarray(self.ys)
+        weights = np.asarray(self.weights)
+        out = np.empty_like(xx)
+        chunk = max(1, ARRAY_CHUNK // max(len(xs), 1))
+        for start in range(0, len(xx), chunk):
+            d = xx[start:start + chunk, None] - xs
+            hits = d == 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                c = weights / d
+                res = (c @ ys) / c.sum(axis=1)
+            rows = hits.any(axis=1)
+            if rows.any():
+                res[rows] = ys[hits[rows].argmax(axis=1)]
+            out[start:start + chunk] = res
+        return out
+
+    def _last_term(self, x):
+        lead = math.fsum(w * y for w, y in zip(self.weights, self.ys))
+        log_scale = -self.log_ref
+        for xi in self.xs[:-1]:
+            d = x - xi
+            if d == 0:
+                return 0.0
+            log_scale += math.log(abs(d))
+            if d < 0:
+                lead = -lead
+        with np.errstate(over='ignore'):
+            return lead * float(np.exp(log_scale))
+
+    def eval_ops(self):
+        return 5 * len(self.xs)
+
+
+class NewtonInterpolator(Interpolator):
+    def __init__(self, points):
+        super().__init__(points)
+        xs = self.xs
+        n = len(xs)
+
+        coeffs = list(self.ys)
+        for level in range(1, n):
+            for i in range(n - 1, level - 1, -1):
+                coeffs[i] = (coeffs[i] - coeffs[i - 1]) / (xs[i] - xs[i - level])
+        self.coeffs = coeffs
+
+    def _evaluate_point(self, x):
+        xs = self.xs
+        coeffs = self.coeffs
+        result = coeffs[0]
+        prod = 1
+        for level in range(1, len(coeffs)):
+            prod *= (x - xs[level - 1])
+            result = result + coeffs[level] * prod
+        return result
+
+    def _evaluate_array(self, xx):
+        xs = self.xs
+        coeffs = self.coeffs
+        result = np.full_like(xx, coeffs[-1])
+        for level in range(len(coeffs) - 2, -1, -1):
+            result *= (xx - xs[level])
+            result += coeffs[level]
+        return result
+
+    def _last_term(self, x):
+        term = self.coeffs[-1]
+        for xi in self.xs[:len(self.coeffs) - 1]:
+            term = term * (x - xi)
+        return term
+
+    def eval_ops(self):
+        return 3 * (len(self.coeffs) - 1)
+
+
+class NewtonBackwardInterpolator(NewtonInterpolator):
+    def __init__(self, points):
+        super().__init__(list(points)[::-1])
+
+
+class IncrementalNewtonInterpolator(NewtonInterpolator):
+    def __init__(self, points=()):
+        self.xs = []
+        self.ys = []
+        self.coeffs = []
+        self.diagonal = []
+        self.fin_diagonal = []
+        for x, y in points:
+            self.append(x, y)
+
+    def append(self, x, y):
+        xs = self.xs
+        n = len(xs)
+        if x in xs:
+            raise ValueError(f"Узел x={x} уже есть")
+
+        diagonal = [y]
+        fin_diagonal = [y]
         for k in range(1, n + 1):
-            prod = reduce(lambda a, b: a * b,
-                          [(t - shifts[j]) for j in range(k)], 1.0)
-            offset = (1 - len(fin_diffs[k]) % 2)
-            delta = fin_diffs[k][len(fin_diffs[k]) // 2 - offset]
-            terms.append(prod * delta / math.factorial(k))
-        return ys[mid] + sum(terms)
+            den = x - xs[n - k]
+            diagonal.append((diagonal[k - 1] - self.diagonal[k - 1]) / den)
+            fin_diagonal.append(fin_diagonal[k - 1] - self.fin_diagonal[k - 1])
 
-    return branch_positive(x0) if x0 > xs[mid] else branch_negative(x0)
+        xs.append(x)
+        self.ys.append(y)
+        self.diagonal = diagonal
+        self.fin_diagonal = fin_diagonal
+        self.coeffs.append(diagonal[-1])
+        return fin_diagonal
 
+    def snapshot(self):
+        interp = NewtonInterpolator.__new__(NewtonInterpolator)
+        interp.xs = list(self.xs)
+        interp.ys = list(self.ys)
+        interp.coeffs = list(self.coeffs)
+        return interp
 
-def interp_stirling(points, x0):
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
 
-    h = xs[1] - xs[0]
-    diff = compute_diff_table(points)
+def central_shifts(count):
+    shifts = []
+    for j in range(count):
+        shifts.append(j // 2 if j % 2 == 0 else -((j + 1) // 2))
+    return shifts
 
-    n = len(xs) - 1
-    alpha = n // 2
 
-    t = (x0 - xs[alpha]) / h
+class GaussInterpolator(Interpolator):
+    def __init__(self, points, diffs=None):
+        super().__init__(points)
+        xs = self.xs
+        count = len(xs)
+        self.mid = (count - 1) // 2
+        self.mid_back = count // 2
+        self.h = xs[1] - xs[0]
 
-    shifts = [0]
-    for i in range(1, n + 1):
-        shifts += [-i, i]
-    shifts = shifts[:n]
+        fin_diffs = compute_diff_table(points) if diffs is None else diffs
+        self.shifts = central_shifts(count - 1)
+        self.deltas_pos = [fin_diffs.entry(k, self.mid - k // 2) for k in range(1, count)]
+        self.deltas_neg = [fin_diffs.entry(k, self.mid_back - (k + 1) // 2)
+                           for k in range(1, count)]
 
-    s_pos = ys[alpha]
-    s_neg = ys[alpha]
-    prod_pos = 1.0
-    prod_neg = 1.0
-    fact = 1.0
+    def _forward(self, x):
+        if self.mid == self.mid_back:
+            return x > self.xs[self.mid]
+        return x < self.xs[self.mid_back]
 
-    for k in range(1, n + 1):
-        fact *= k
-        shift = shifts[k - 1]
+    def _side(self, x):
+        if self._forward(x):
+            return self.mid, 1, self.deltas_pos
+        return self.mid_back, -1, self.deltas_neg
 
-        prod_pos *= (t + shift)
-        prod_neg *= (t - shift)
+    def _evaluate_point(self, x):
+        centre, sign, deltas = self._side(x)
+        t = (x - self.xs[centre]) / self.h
 
-        col = diff[k]
-        idx_center = len(col) // 2
-        delta_center = col[idx_center]
+        total = 0
+        coeff = 1
+        for k, delta in enumerate(deltas, start=1):
+            coeff *= (t + sign * self.shifts[k - 1]) / k
+            total += coeff * delta
+        return self.ys[centre] + total
 
-        offset = 1 - (len(col) % 2)
-        delta_side = col[idx_center - offset]
+    def _evaluate_array(self, xx):
+        forward = self._forward(xx)
+        centre = np.where(forward, self.mid, self.mid_back)
+        xs = np.asarray(self.xs)
+        t = (xx - xs[centre]) / self.h
+        sign = np.where(forward, 1.0, -1.0)
 
-        s_pos += prod_pos * delta_center / fact
-        s_neg += prod_neg * delta_side / fact
+        total = np.zeros_like(xx)
+        coeff = np.ones_like(xx)
+        for k in range(1, len(self.deltas_pos) + 1):
+            coeff *= (t + sign * self.shifts[k - 1]) / k
+            total += coeff * np.where(forward, self.deltas_pos[k - 1],
+                                      self.deltas_neg[k - 1])
+        return np.asarray(self.ys)[centre] + total
 
-    return 0.5 * (s_pos + s_neg)
+    def _last_term(self, x):
+        centre, sign, deltas = self._side(x)
+        if not deltas:
+            return 0
+        t = (x - self.xs[centre]) / self.h
+        coeff = 1
+        for k in range(1, len(deltas) + 1):
+            coeff *= (t + sign * self.shifts[k - 1]) / k
+        return coeff * deltas[-1]
 
+    def eval_ops(self):
+        return 5 * len(self.deltas_pos) + 2
+
+
+class StirlingInterpolator(Interpolator):
+    def __init__(self, points, diffs=None):
+        super().__init__(points)
+        xs = self.xs
+        n = len(xs) - 1
+        self.alpha = n // 2
+        self.h = xs[1] - xs[0]
+
+        diff = compute_diff_table(points) if diffs is None else diffs
+        self.shifts = central_shifts(n)
+        self.deltas_center = [diff.entry(k, self.alpha - k // 2) for k in range(1, n + 1)]
+        self.deltas_side = [diff.entry(k, self.alpha - (k + 1) // 2) for k in range(1, n + 1)]
+
+    def _evaluate_point(self, x):
+        alpha = self.alpha
+        t = (x - self.xs[alpha]) / self.h
+
+        s_pos = self.ys[alpha]
+        s_neg = self.ys[alpha]
+        coeff_pos = 1
+        coeff_neg = 1
+        for k, shift in enumerate(self.shifts, start=1):
+            coeff_pos *= (t + shift) / k
+            coeff_neg *= (t - shift) / k
+            s_pos = s_pos + coeff_pos * self.deltas_center[k - 1]
+            s_neg = s_neg + coeff_neg * self.deltas_side[k - 1]
+
+        return (s_pos + s_neg) / 2
+
+    def _evaluate_array(self, xx):
+        alpha = self.alpha
+        t = (xx - self.xs[alpha]) / self.h
+
+        s_pos = np.full_like(xx, self.ys[alpha])
+        s_neg = np.full_like(xx, self.ys[alpha])
+        coeff_pos = np.ones_like(xx)
+        coeff_neg = np.ones_like(xx)
+        for k, shift in enumerate(self.shifts, start=1):
+            coeff_pos *= (t + shift) / k
+            coeff_neg *= (t - shift) / k
+            s_pos += coeff_pos * self.deltas_center[k - 1]
+            s_neg += coeff_neg * self.deltas_side[k - 1]
+
+        return 0.5 * (s_pos + s_neg)
+
+    def _last_term(self, x):
+        if not self.shifts:
+            return 0
+        t = (x - self.xs[self.alpha]) / self.h
+        coeff_pos = 1
+        coeff_neg = 1
+        for k, shift in enumerate(self.shifts, start=1):
+            coeff_pos *= (t + shift) / k
+            coeff_neg *= (t - shift) / k
+        return (coeff_pos * self.deltas_center[-1] + coeff_neg * self.deltas_side[-1]) / 2
+
+    def eval_ops(self):
+        return 10 * len(self.shifts) + 3
 
-def interp_bessel(points, x0):
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
 
-    h = xs[1] - xs[0]
-    diff = compute_diff_table(points)
+class BesselInterpolator(Interpolator):
+    def __init__(self, points, diffs=None):
+        super().__init__(points)
+        xs = self.xs
+        ys = self.ys
+        self.h = xs[1] - xs[0]
 
-    n = len(xs)
-    m = n // 2 - 1
+        diff = compute_diff_table(points) if diffs is None else diffs
+        n = len(xs)
+        m = n // 2 - 1
+        self.m = m
+        self.base = (ys[m] + ys[m + 1]) / 2
+        self.delta1 = diff.entry(1, m)
 
-    t = (x0 - xs[m]) / h
+        self.terms = []
+        r = 1
+        while True:
+            k_even = 2 * r
+            k_odd = k_even + 1
 
-    result = 0.5 * (ys[m] + ys[m + 1])
-    result += (t - 0.5) * diff[1][m]
+            avg = None
+            if k_even < len(diff):
+                left = m - r
+                right = left + 1
+                if 0 <= left and right < n - k_even:
+                    avg = (diff.entry(k_even, left) + diff.entry(k_even, right)) / 2
 
-    even_coeff = t * (t - 1) / 2
-    odd_coeff = (t - 0.5) * t * (t - 1) / 6
+            odd = None
+            if k_odd < len(diff):
+                idx = m - r
+                if 0 <= idx < n - k_odd:
+                    odd = diff.entry(k_odd, idx)
 
-    r = 1
-    while True:
-        k_even = 2 * r
-        k_odd = k_even + 1
+            self.terms.append((avg, odd))
 
-        if k_even < len(diff):
-            left = m - r
-            right = left + 1
-            if 0 <= left and right < len(diff[k_even]):
-                avg = 0.5 * (diff[k_even][left] + diff[k_even][right])
+            if k_even >= len(diff) and k_odd >= len(diff):
+                break
+            if m - r - 1 < 0:
+                break
+            r += 1
+
+    def _evaluate_point(self, x):
+        t = (x - self.xs[self.m]) / self.h
+
+        result = self.base + (2 * t - 1) / 2 * self.delta1
+
+        even_coeff = t * (t - 1) / 2
+        odd_coeff = (2 * t - 1) * t * (t - 1) / 12
+
+        for r, (avg, odd) in enumerate(self.terms, start=1):
+            if r > 1:
+                even_coeff *= (t + r - 1) * (t - r) / ((2 * r) * (2 * r - 1))
+                odd_coeff *= (t + r - 1) * (t - r) / ((2 * r + 1) * (2 * r))
+            if avg is not None:
                 result += even_coeff * avg
+            if odd is not None:
+                result += odd_coeff * odd
 
-        if k_odd < len(diff):
-            idx = m - r
-            if 0 <= idx < len(diff[k_odd]):
-                result += odd_coeff * diff[k_odd][idx]
+        return result
 
-        if k_even >= len(diff) and k_odd >= len(diff):
-            break
+    def _evaluate_array(self, xx):
+        t = (xx - self.xs[self.m]) / self.h
+
+        result = self.base + (t - 0.5) * self.delta1
+
+        even_coeff = t * (t - 1) / 2
+        odd_coeff = (t - 0.5) * t * (t - 1) / 6
+
+        for r, (avg, odd) in enumerate(self.terms, start=1):
+            if r > 1:
+                even_coeff *= (t + r - 1) * (t - r) / ((2 * r) * (2 * r - 1))
+                odd_coeff *= (t + r - 1) * (t - r) / ((2 * r + 1) * (2 * r))
+            if avg is not None:
+                result += even_coeff * avg
+            if odd is not None:
+                result += odd_coeff * odd
+
+        return result
+
+    def _last_term(self, x):
+        t = (x - self.xs[self.m]) / self.h
+        last = (2 * t - 1) / 2 * self.delta1
+
+        even_coeff = t * (t - 1) / 2
+        odd_coeff = (2 * t - 1) * t * (t - 1) / 12
+
+        for r, (avg, odd) in enumerate(self.terms, start=1):
+            if r > 1:
+                even_coeff *= (t + r - 1) * (t - r) / ((2 * r) * (2 * r - 1))
+                odd_coeff *= (t + r - 1) * (t - r) / ((2 * r + 1) * (2 * r))
+            if avg is not None:
+                last = even_coeff * avg
+            if odd is not None:
+                last = odd_coeff * odd
+
+        return last
+
+    def eval_ops(self):
+        return 14 * len(self.terms) + 6
+
+
+def chebyshev_nodes(left, right, count):
+    k = np.arange(count)
+    nodes = np.cos(np.pi * (k + 0.5) / count)[::-1]
+    return 0.5 * (left + right) + 0.5 * (right - left) * nodes
+
+
+def chebyshev_interval(xs):
+    count = len(xs)
+    half = (xs[-1] - xs[0]) / (2 * math.cos(math.pi / (2 * count)))
+    mid = 0.5 * (xs[0] + xs[-1])
+    return mid - half, mid + half
+
+
+def is_chebyshev(xs, rtol=1e-9):
+    xs = np.asarray(xs, dtype=float)
+    if len(xs) < 2 or xs[-1] <= xs[0]:
+        return False
+    left, right = chebyshev_interval(xs)
+    expected = chebyshev_nodes(left, right, len(xs))
+    return bool(np.all(np.abs(xs - expected) <= rtol * (right - left)))
+
+
+def dct2(values):
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    v = np.concatenate([values[::2], values[1::2][::-1]])
+    k = np.arange(n).reshape((n,) + (1,) * (values.ndim - 1))
+    return np.real(np.fft.fft(v, axis=0) * np.exp(-1j * np.pi * k / (2 * n)))
+
+
+class ChebyshevInterpolator(Interpolator):
+    def __init__(self, points):
+        super().__init__(points)
+        if not is_chebyshev(self.xs):
+            raise ValueError("Метод Чебышёва требует узлы Чебышёва")
+        n = len(self.xs)
+        self.left, self.right = chebyshev_interval(self.xs)
+        coeffs = dct2(self.ys[::-1]) * (2.0 / n)
+        coeffs[0] *= 0.5
+        self.coeffs = coeffs.tolist() if coeffs.ndim == 1 else list(coeffs)
+
+    def _evaluate_point(self, x):
+        u = (2 * x - (self.left + self.right)) / (self.right - self.left)
+        b1 = 0.0
+        b2 = 0.0
+        for c in self.coeffs[:0:-1]:
+            b1, b2 = c + 2 * u * b1 - b2, b1
+        return self.coeffs[0] + u * b1 - b2
+
+    def _evaluate_array(self, xx):
+        u = (2 * xx - (self.left + self.right)) / (self.right - self.left)
+        b1 = np.zeros_like(xx)
+        b2 = np.zeros_like(xx)
+        for c in self.coeffs[:0:-1]:
+            b1, b2 = c + 2 * u * b1 - b2, b1
+        return self.coeffs[0] + u * b1 - b2
+
+    def _last_term(self, x):
+        return self.coeffs[-1]
+
+    def eval_ops(self):
+        return 4 * len(self.coeffs) + 4
+
+
+def solve_tridiagonal(lower, diag, upper, rhs):
+    n = len(diag)
+    c = [0.0] * n
+    d = [None] * n
+    c[0] = upper[0] / diag[0] if n > 1 else 0.0
+    d[0] = rhs[0] / diag[0]
+    for i in range(1, n):
+        den = diag[i] - lower[i] * c[i - 1]
+        if i < n - 1:
+            c[i] = upper[i] / den
+        d[i] = (rhs[i] - lower[i] * d[i - 1]) / den
+    for i in range(n - 2, -1, -1):
+        d[i] = d[i] - c[i] * d[i + 1]
+    return d
+
+
+def _parabola_slope(xs, ys, x):
+    d0 = (ys[1] - ys[0]) / (xs[1] - xs[0])
+    d1 = (ys[2] - ys[1]) / (xs[2] - xs[1])
+    c = (d1 - d0) / (xs[2] - xs[0])
+    return d0 + c * (2 * x - xs[0] - xs[1])
+
+
+class PiecewiseInterpolator(Interpolator):
+    has_remainder = True
+
+    def __init__(self, points):
+        points = PointSet.from_points(points).sorted()
+        self.xs = self.nodes = points.xs
+        self.ys = values = points.ys
+        if len(self.xs) < 2:
+            raise ValueError("Нужно хотя бы два узла")
+        h = np.diff(self.nodes)
+        if np.any(h <= 0):
+            raise ValueError("Узлы должны быть различными")
+        h = h.reshape((-1,) + (1,) * (values.ndim - 1))
+        delta = np.diff(values, axis=0) / h
+        slopes = self._slopes(values, delta)
+        self.coeffs = np.stack([
+            values[:-1],
+            slopes[:-1],
+            (3 * delta - 2 * slopes[:-1] - slopes[1:]) / h,
+            (slopes[:-1] + slopes[1:] - 2 * delta) / (h * h),
+        ])
+
+    def _slopes(self, values, delta):
+        raise NotImplementedError
+
+    def _segment(self, x):
+        idx = int(np.searchsorted(self.nodes, x, side='right'))
+        return min(max(idx - 1, 0), len(self.nodes) - 2)
+
+    def _evaluate_point(self, x):
+        i = self._segment(x)
+        dx = x - self.xs[i]
+        a, b, c, d = self.coeffs[:, i]
+        return a + dx * (b + dx * (c + dx * d))
+
+    def _evaluate_array(self, xx):
+        nodes = self.nodes
+        idx = np.clip(np.searchsorted(nodes, xx, side='right') - 1, 0, len(nodes) - 2)
+        dx = xx - nodes[idx]
+        a, b, c, d = self.coeffs[:, idx]
+        return a + dx * (b + dx * (c + dx * d))
+
+    def _last_term(self, x):
+        start = min(max(self._segment(x) - 1, 0), max(len(self.xs) - 5, 0))
+        stop = start + 5
+        local = NewtonInterpolator(PointSet(self.xs[start:stop], self.ys[start:stop]))
+        return local._last_term(x)
+
+    def eval_ops(self):
+        return (len(self.xs) - 1).bit_length() + 8
+
+
+class CubicSplineInterpolator(PiecewiseInterpolator):
+    boundary = 'natural'
+
+    def __init__(self, points, boundary=None, end_slopes=None):
+        if boundary is not None:
+            self.boundary = boundary
+        if self.boundary not in ('natural', 'clamped', 'not-a-knot'):
+            raise ValueError(f"Неизвестное краевое условие: {self.boundary}")
+        self.end_slopes = end_slopes
+        super().__init__(points)
+
+    def _end_slopes(self, values):
+        if self.end_slopes is not None:
+            return self.end_slopes
+        xs = self.xs
+        if len(xs) < 3:
+            slope = (values[1] - values[0]) / (xs[1] - xs[0])
+            return slope, slope
+        return (_parabola_slope(xs[:3], values[:3], xs[0]),
+                _parabola_slope(xs[-3:], values[-3:], xs[-1]))
+
+    def _slopes(self, values, delta):
+        xs = self.xs
+        n = len(xs)
+        if self.boundary == 'not-a-knot' and n < 4:
+            if n == 2:
+                return np.stack([delta[0], delta[0]])
+            return np.stack([_parabola_slope(xs, values, x) for x in xs])
+
+        h = np.diff(self.nodes)
+        hh = h.reshape((-1,) + (1,) * (delta.ndim - 1))
+        lower = np.zeros(n)
+        diag = np.zeros(n)
+        upper = np.zeros(n)
+        rhs = np.zeros((n,) + delta.shape[1:])
+        lower[1:-1] = h[1:]
+        diag[1:-1] = 2 * (h[:-1] + h[1:])
+        upper[1:-1] = h[:-1]
+        rhs[1:-1] = 3 * (hh[1:] * delta[:-1] + hh[:-1] * delta[1:])
+
+        if self.boundary == 'natural':
+            diag[0], upper[0], rhs[0] = 2.0, 1.0, 3 * delta[0]
+            lower[-1], diag[-1], rhs[-1] = 1.0, 2.0, 3 * delta[-1]
+        elif self.boundary == 'clamped':
+            left, right = self._end_slopes(values)
+            diag[0], upper[0], rhs[0] = 1.0, 0.0, left
+            lower[-1], diag[-1], rhs[-1] = 0.0, 1.0, right
+        else:
+            span = xs[2] - xs[0]
+            diag[0], upper[0] = h[1], span
+            rhs[0] = ((h[0] + 2 * span) * h[1] * delta[0] + h[0] ** 2 * delta[1]) / span
+            span = xs[-1] - xs[-3]
+            lower[-1], diag[-1] = span, h[-2]
+            rhs[-1] = (h[-1] ** 2 * delta[-2]
+                       + (2 * span + h[-1]) * h[-2] * delta[-1]) / span
+
+        rhs = rhs.tolist() if rhs.ndim == 1 else list(rhs)
+        slopes = solve_tridiagonal(lower.tolist(), diag.tolist(), upper.tolist(), rhs)
+        return np.array(slopes, dtype=float)
+
+
+class ClampedSplineInterpolator(CubicSplineInterpolator):
+    boundary = 'clamped'
+
+
+class NotAKnotSplineInterpolator(CubicSplineInterpolator):
+    boundary = 'not-a-knot'
+
+
+class AkimaInterpolator(PiecewiseInterpolator):
+    def _slopes(self, values, delta):
+        n = len(self.xs)
+        if n < 3:
+            return np.stack([delta[0], delta[0]])
+        m = np.empty((n + 3,) + delta.shape[1:])
+        m[2:-2] = delta
+        m[1] = 2 * m[2] - m[3]
+        m[0] = 2 * m[1] - m[2]
+        m[-2] = 2 * m[-3] - m[-4]
+        m[-1] = 2 * m[-2] - m[-3]
+        w1 = np.abs(m[3:] - m[2:-1])
+        w2 = np.abs(m[1:-2] - m[:-3])
+        total = w1 + w2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slopes = (w1 * m[1:-2] + w2 * m[2:-1]) / total
+        return np.where(total > 0, slopes, 0.5 * (m[1:-2] + m[2:-1]))
+
+
+def window_starts(nodes, k, xx):
+    n = len(nodes)
+    idx = np.searchsorted(nodes, xx, side='right')
+    if k % 2:
+        left = nodes[np.clip(idx - 1, 0, n - 1)]
+        right = nodes[np.clip(idx, 0, n - 1)]
+        closer_left = (idx == n) | ((idx > 0) & (xx - left <= right - xx))
+        idx = idx - closer_left
+    return np.clip(idx - k // 2, 0, n - k)
 
-        if m - r - 1 < 0:
+
+class WindowedInterpolator(Interpolator):
+    def __init__(self, points, method, k, cache_size=WINDOW_CACHE_SIZE):
+        self.points = PointSet.from_points(points).sorted()
+        self.xs = self.nodes = self.points.xs
+        self.ys = self.points.ys
+        n = len(self.xs)
+        if not 2 <= k <= n:
+            raise ValueError(f"Размер окна должен быть от 2 до {n}")
+        self.method = method
+        self.k = k
+        self.has_remainder = k < n
+        self.cache = LRUCache(cache_size)
+
+    def _window_start(self, x):
+        return int(window_starts(self.nodes, self.k, x))
+
+    def _window_starts(self, xx):
+        return window_starts(self.nodes, self.k, xx)
+
+    def local(self, start):
+        return self.cache.get_or_create(start, lambda: self._fit_window(start))
+
+    def _fit_window(self, start):
+        return self.method(self.points[start:start + self.k])
+
+    def _evaluate_point(self, x):
+        return self.local(self._window_start(x)).evaluate(x)
+
+    def _evaluate_array(self, xx):
+        starts = self._window_starts(xx)
+        order = np.argsort(starts, kind='stable')
+        sorted_starts = starts[order]
+        bounds = np.flatnonzero(np.diff(sorted_starts)) + 1
+        out = np.empty_like(xx)
+        for group in np.split(order, bounds):
+            if len(group):
+                start = int(starts[group[0]])
+                out[group] = self.local(start).evaluate(xx[group])
+        return out
+
+    def _last_term(self, x):
+        start = self._window_start(x)
+        stop = start + self.k
+        xs = self.xs
+        if stop == len(xs) and start == 0:
+            return self.local(start)._last_term(x)
+        if stop < len(xs) and (start == 0 or xs[stop] - x <= x - xs[start - 1]):
+            extra = stop
+        else:
+            extra = start - 1
+        idx = np.append(np.arange(start, stop), extra)
+        return NewtonInterpolator(PointSet(xs[idx], self.ys[idx]))._last_term(x)
+
+    def eval_ops(self):
+        return self.local(0).eval_ops() + max(len(self.xs) - 1, 1).bit_length()
+
+
+class PreciseInterpolator(Interpolator):
+    def __init__(self, points, method, precision='fraction', digits=PRECISION_DIGITS):
+        super().__init__(points)
+        if precision not in PRECISIONS[1:]:
+            raise ValueError(f"Неизвестная точность: {precision}")
+        if precision == 'mpmath':
+            try:
+                import mpmath
+            except ImportError:
+                raise ValueError("Для точности mpmath нужен пакет mpmath") from None
+        self.method = method
+        self.precision = precision
+        self.digits = digits
+        with self._context():
+            self.exact = method([(self._convert(x), self._convert(y))
+                                 for x, y in zip(self.xs, self.ys)])
+
+    @contextlib.contextmanager
+    def _context(self):
+        if self.precision == 'decimal':
+            import decimal
+            with decimal.localcontext() as ctx:
+                ctx.prec = self.digits
+                yield
+        elif self.precision == 'mpmath':
+            import mpmath
+            with mpmath.workdps(self.digits):
+                yield
+        else:
+            yield
+
+    def _convert(self, value):
+        value = float(value)
+        if self.precision == 'fraction':
+            from fractions import Fraction
+            return Fraction(value)
+        if self.precision == 'decimal':
+            import decimal
+            return decimal.Decimal(value)
+        import mpmath
+        return mpmath.mpf(value)
+
+    def _evaluate_point(self, x):
+        with self._context():
+            return float(self.exact._evaluate_point(self._convert(x)))
+
+    def _evaluate_array(self, xx):
+        with self._context():
+            return np.array([float(self.exact._evaluate_point(self._convert(x)))
+                             for x in xx.tolist()])
+
+    def _last_term(self, x):
+        with self._context():
+            return float(self.exact._last_term(self._convert(x)))
+
+    def eval_ops(self):
+        return self.exact.eval_ops()
+
+
+class AutoInterpolator(Interpolator):
+    methods = {
+        'newton': NewtonInterpolator,
+        'newton_backward': NewtonBackwardInterpolator,
+        'gauss': GaussInterpolator,
+        'stirling': StirlingInterpolator,
+        'bessel': BesselInterpolator,
+        'lagrange': BarycentricInterpolator,
+    }
+
+    def __init__(self, points, window=0):
+        self.points = PointSet.from_points(points).sorted()
+        self.xs = self.nodes = self.points.xs
+        self.ys = self.points.ys
+        n = len(self.xs)
+        self.k = window if window and window < n else n
+        self.window = window if self.k < n else 0
+        self.has_remainder = bool(self.window)
+        self.equispaced = self.points.is_equispaced()
+        self.h = float(self.xs[-1] - self.xs[0]) / (n - 1) if self.equispaced else None
+        self.fitted = {}
+        self.used = {}
+
+    def _interp(self, key):
+        interp = self.fitted.get(key)
+        if interp is None:
+            interp = _fit(self.methods[key], self.points, self.window)
+            self.fitted[key] = interp
+        return interp
+
+    def choices(self, xx):
+        xx = np.asarray(xx, dtype=float)
+        if not self.equispaced:
+            return np.full(xx.shape, 'lagrange', dtype=object)
+        k = self.k
+        last = k - 1
+        if k < 4:
+            return np.full(xx.shape, 'newton', dtype=object)
+        starts = window_starts(self.nodes, k, xx) if self.window else 0
+        s = (xx - self.nodes[starts]) / self.h
+        if k % 2:
+            t = s - last / 2
+            centre = np.where(np.abs(t) <= AUTO_EDGE, 'stirling', 'gauss')
+        else:
+            t = s - (k // 2 - 1)
+            centre = np.where((t >= AUTO_EDGE) & (t <= 1 - AUTO_EDGE), 'bessel', 'gauss')
+        return np.where(s < last * AUTO_EDGE, 'newton',
+                        np.where(s > last * (1 - AUTO_EDGE), 'newton_backward', centre)
+                        ).astype(object)
+
+    def choose(self, x):
+        return self.choices(np.array([x], dtype=float))[0]
+
+    def _evaluate_point(self, x):
+        key = self.choose(x)
+        self.used = {key: 1}
+        return self._interp(key).evaluate(x)
+
+    def _evaluate_array(self, xx):
+        keys = self.choices(xx)
+        out = np.empty_like(xx)
+        self.used = {}
+        for key in set(keys.tolist()):
+            mask = keys == key
+            self.used[key] = int(mask.sum())
+            out[mask] = self._interp(key).evaluate(xx[mask])
+        return out
+
+    def _last_term(self, x):
+        return self._interp(self.choose(x))._last_term(x)
+
+    def eval_ops(self):
+        used = self.used or dict.fromkeys(self.fitted, 1)
+        if not used:
+            return 8
+        total = sum(self.fitted[key].eval_ops() * count for key, count in used.items())
+        return total // sum(used.values()) + 8
+
+
+def fit(method, points, window=0, key=None, precision='float', digits=PRECISION_DIGITS):
+    if key is None:
+        key = fingerprint(points)
+    if precision == 'float':
+        cache_key = (key, method.__name__, window)
+    else:
+        cache_key = (key, method.__name__, window, precision, digits)
+    return copy.copy(FIT_CACHE.get_or_create(
+        cache_key, lambda: _fit(method, points, window, precision, digits, key)))
+
+
+def _fit(method, points, window, precision='float', digits=PRECISION_DIGITS, key=None):
+    if method is AutoInterpolator:
+        if precision != 'float':
+            raise ValueError("Автовыбор работает только с обычной точностью")
+        return AutoInterpolator(points, window)
+    if isinstance(method, type) and issubclass(method, PiecewiseInterpolator):
+        window = 0
+    if precision != 'float':
+        method = functools.partial(PreciseInterpolator,
+                                   method=PRECISE_METHODS.get(method, method),
+                                   precision=precision, digits=digits)
+    if window and window < len(points):
+        return WindowedInterpolator(points, method, window)
+    if method in FINITE_DIFFERENCE_METHODS:
+        return method(points, cached_diff_table(points, key))
+    return method(points)
+
+
+def cached_diff_table(points, key=None):
+    if key is None:
+        key = fingerprint(points)
+    return FIT_CACHE.get_or_create((key, 'diffs'), lambda: compute_diff_table(points))
+
+
+def interp_lagrange(points, x0):
+    return LagrangeInterpolator(points).evaluate(x0)
+
+
+def interp_barycentric(points, x0):
+    return BarycentricInterpolator(points).evaluate(x0)
+
+
+def interp_newton(points, x0):
+    return NewtonInterpolator(points).evaluate(x0)
+
+
+def interp_gauss(points, x0):
+    return GaussInterpolator(points).evaluate(x0)
+
+
+def interp_stirling(points, x0):
+    return StirlingInterpolator(points).evaluate(x0)
+
+
+def interp_bessel(points, x0):
+    return BesselInterpolator(points).evaluate(x0)
+
+
+def interp_chebyshev(points, x0):
+    return ChebyshevInterpolator(points).evaluate(x0)
+
+
+def interp_auto(points, x0):
+    return AutoInterpolator(points).evaluate(x0)
+
+
+def interp_spline(points, x0, boundary='natural'):
+    return CubicSplineInterpolator(points, boundary).evaluate(x0)
+
+
+def interp_akima(points, x0):
+    return AkimaInterpolator(points).evaluate(x0)
+
+
+METHODS = {
+    'lagrange': BarycentricInterpolator,
+    'newton': NewtonInterpolator,
+    'gauss': GaussInterpolator,
+    'stirling': StirlingInterpolator,
+    'bessel': BesselInterpolator,
+    'chebyshev': ChebyshevInterpolator,
+    'spline': CubicSplineInterpolator,
+    'spline_clamped': ClampedSplineInterpolator,
+    'spline_notaknot': NotAKnotSplineInterpolator,
+    'akima': AkimaInterpolator,
+    'auto': AutoInterpolator,
+}
+
+
+FINITE_DIFFERENCE_METHODS = (GaussInterpolator, StirlingInterpolator, BesselInterpolator)
+
+PRECISE_METHODS = {
+    BarycentricInterpolator: LagrangeInterpolator,
+}
+
+
+METHOD_LABELS = {
+    'lagrange': 'Лагранж',
+    'newton': 'Ньютон',
+    'gauss': 'Гаусс',
+    'stirling': 'Стирлинг',
+    'bessel': 'Бессель',
+    'chebyshev': 'Чебышёв',
+    'spline': 'Сплайн (естественный)',
+    'spline_clamped': 'Сплайн (закреплённый)',
+    'spline_notaknot': 'Сплайн (not-a-knot)',
+    'akima': 'Акима',
+    'auto': 'Авто',
+    'newton_backward': 'Ньютон (назад)',
+}
+
+
+def adaptive_grid(func, a, b, initial=ADAPTIVE_INITIAL, max_samples=ADAPTIVE_MAX,
+                  tol=ADAPTIVE_TOL):
+    xx = np.linspace(a, b, initial)
+    yy = func(xx)
+    while len(xx) < max_samples:
+        mid = 0.5 * (xx[:-1] + xx[1:])
+        ym = func(mid)
+        finite = yy[np.isfinite(yy)]
+        scale = float(finite.max() - finite.min()) if len(finite) else 0.0
+        err = np.abs(ym - 0.5 * (yy[:-1] + yy[1:]))
+        refine = np.flatnonzero(err > tol * (scale or 1.0))
+        if not len(refine):
             break
+        budget = max_samples - len(xx)
+        if len(refine) > budget:
+            refine = refine[np.argsort(err[refine])[-budget:]]
+        xx = np.concatenate([xx, mid[refine]])
+        yy = np.concatenate([yy, ym[refine]])
+        order = np.argsort(xx, kind='stable')
+        xx = xx[order]
+        yy = yy[order]
+    return xx, yy
+
+
+def compute_curves(points, x0, window=0, methods=None, tol=ADAPTIVE_TOL, func=None,
+                   check=None):
+    fp = fingerprint(points)
+    a = points[0][0]
+    b = points[-1][0]
+    curves = {}
+    errors = {}
+    marker = None
+    for key, method in METHODS.items():
+        if methods is not None and not methods.get(key):
+            continue
+        if method_error(key, points, window):
+            continue
+        if check is not None:
+            check()
+        interp = fit(method, points, window, fp)
+        if marker is None:
+            marker = interp
+        curves[key] = CURVE_CACHE.get_or_create(
+            (fp, key, window, a, b, tol),
+            lambda i=interp: adaptive_grid(i.evaluate, a, b, tol=tol))
+        if func is not None:
+            xx, yy = curves[key]
+            errors[key] = float(np.nanmax(np.abs(func(xx) - yy)))
+    if func is not None:
+        curves['function'] = CURVE_CACHE.get_or_create(
+            (func, a, b, tol), lambda: adaptive_grid(func, a, b, tol=tol))
+    if marker is None:
+        fallback = NewtonInterpolator
+        if method_error('newton', points, window):
+            fallback = CubicSplineInterpolator
+        marker = fit(fallback, points, window, fp)
+    y0 = marker.evaluate(x0)
+    return curves, y0, errors
+
+
+_worker_state = {}
+
+
+def _parallel_init(interp, x_name, out_name, size):
+    from multiprocessing import shared_memory
+    x_shm = shared_memory.SharedMemory(name=x_name)
+    out_shm = shared_memory.SharedMemory(name=out_name)
+    _worker_state['interp'] = interp
+    _worker_state['shm'] = (x_shm, out_shm)
+    _worker_state['xx'] = np.ndarray((size,), dtype=float, buffer=x_shm.buf)
+    _worker_state['out'] = np.ndarray((size,), dtype=float, buffer=out_shm.buf)
 
-        even_coeff *= (t + r) * (t - r - 1) / ((2 * r + 2) * (2 * r + 1))
-        odd_coeff *= (t + r) * (t - r - 1) / ((2 * r + 3) * (2 * r + 2))
 
-        r += 1
+def _parallel_chunk(start, stop):
+    state = _worker_state
+    state['out'][start:stop] = state['interp'].evaluate(state['xx'][start:stop])
 
-    return result
 
+def evaluate_parallel(interp, x, workers=None, chunk_size=PARALLEL_CHUNK):
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
 
-def process_data(kind, data, methods, x_star, gui):
+    xx = np.asarray(x, dtype=float)
+    flat = xx.ravel()
+    size = len(flat)
+    if workers == 1 or size <= chunk_size:
+        return interp.evaluate(xx)
+
+    x_shm = shared_memory.SharedMemory(create=True, size=flat.nbytes)
+    out_shm = shared_memory.SharedMemory(create=True, size=flat.nbytes)
     try:
-        if kind == 'file':
-            points = []
-            with open(data, newline='') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 2:
-                        x_val = float(row[0])
-                        y_val = float(row[1])
-                        points.append((x_val, y_val))
-
-        elif kind == 'func':
-            name = data['name']
-            left = data['left']
-            right = data['right']
-            count = data['n']
-            func = FUNCTION_MAP[name]
+        np.ndarray((size,), dtype=float, buffer=x_shm.buf)[:] = flat
+        with ProcessPoolExecutor(workers, initializer=_parallel_init,
+                                 initargs=(interp, x_shm.name, out_shm.name, size)) as pool:
+            tasks = [pool.submit(_parallel_chunk, start, min(start + chunk_size, size))
+                     for start in range(0, size, chunk_size)]
+            for task in tasks:
+                task.result()
+        out = np.ndarray((size,), dtype=float, buffer=out_shm.buf).copy()
+    finally:
+        x_shm.close()
+        x_shm.unlink()
+        out_shm.close()
+        out_shm.unlink()
+    return out.reshape(xx.shape)
+
+
+def _parse_lines(lines, first_line, delimiter, columns):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        try:
+            return np.loadtxt(lines, dtype=float, delimiter=delimiter,
+                              usecols=columns, ndmin=2)
+        except ValueError:
+            pass
+        for offset, line in enumerate(lines):
+            try:
+                np.loadtxt([line], dtype=float, delimiter=delimiter,
+                           usecols=columns, ndmin=2)
+            except ValueError as e:
+                msg = re.sub(r" at row \d+(, column \d+\.?| with \d+ columns)$", "", str(e))
+                raise ValueError(f"строка {first_line + offset}: {msg}") from None
+        raise ValueError(f"строки {first_line}–{first_line + len(lines) - 1}: "
+                         f"неверный формат")
+
+
+def iter_csv_chunks(path, delimiter=',', header=False, columns=(0, 1),
+                    chunk_rows=CSV_CHUNK_ROWS):
+    with open(path, newline='') as f:
+        line_no = 1
+        if header:
+            next(f, None)
+            line_no += 1
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            if not lines:
+                break
+            yield _parse_lines(lines, line_no, delimiter, columns)
+            line_no += len(lines)
+
+
+def load_csv(path, delimiter=',', header=False, columns=(0, 1),
+             chunk_rows=CSV_CHUNK_ROWS):
+    chunks = list(iter_csv_chunks(path, delimiter, header, columns, chunk_rows))
+    data = np.concatenate(chunks) if chunks else np.empty((0, 2))
+    xs = np.ascontiguousarray(data[:, 0])
+    ys = np.ascontiguousarray(data[:, 1])
+    if len(xs) > 1 and np.any(xs[1:] < xs[:-1]):
+        order = np.argsort(xs, kind='stable')
+        xs = xs[order]
+        ys = ys[order]
+    return xs, ys
+
+
+def load_channels(path, delimiter=',', header=False, x_column=0,
+                  chunk_rows=CSV_CHUNK_ROWS):
+    chunks = list(iter_csv_chunks(path, delimiter, header, None, chunk_rows))
+    if not chunks:
+        raise ValueError("Файл не содержит данных")
+    data = np.concatenate(chunks)
+    if data.shape[1] < 2:
+        raise ValueError("Нужен столбец x и хотя бы один канал")
+    xs = np.ascontiguousarray(data[:, x_column])
+    ys = np.delete(data, x_column, axis=1).T
+    if len(xs) > 1 and np.any(xs[1:] < xs[:-1]):
+        order = np.argsort(xs, kind='stable')
+        xs = xs[order]
+        ys = ys[:, order]
+    return xs, np.ascontiguousarray(ys)
+
+
+def is_equispaced(xs, rtol=1e-9):
+    xs = np.asarray(xs, dtype=float)
+    if len(xs) < 2:
+        return False
+    h = (xs[-1] - xs[0]) / (len(xs) - 1)
+    if h == 0:
+        return False
+    scale = max(abs(xs[0]), abs(xs[-1]))
+    tol = rtol * abs(h) + 64 * np.finfo(float).eps * scale
+    return bool(np.all(np.abs(np.diff(xs) - h) <= tol))
+
+
+def save_binary(path, xs, ys, dtype='<f8'):
+    dtype = np.dtype(dtype)
+    xs = np.asarray(xs, dtype=dtype)
+    ys = np.asarray(ys, dtype=dtype)
+    if xs.shape != ys.shape or xs.ndim != 1:
+        raise ValueError("x и y должны быть одномерными массивами одной длины")
+
+    flags = 0
+    h = 0.0
+    if len(xs) < 2 or np.all(xs[1:] >= xs[:-1]):
+        flags |= FLAG_SORTED
+    if is_equispaced(xs):
+        flags |= FLAG_EQUISPACED
+        h = float(xs[-1] - xs[0]) / (len(xs) - 1)
+    x0 = float(xs[0]) if len(xs) else 0.0
+
+    header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, flags,
+                                dtype.str.encode().ljust(8, b"\0"), len(xs), h, x0)
+    with open(path, 'wb') as f:
+        f.write(header.ljust(BINARY_HEADER_SIZE, b"\0"))
+        xs.tofile(f)
+        ys.tofile(f)
+
+
+def load_binary(path):
+    with open(path, 'rb') as f:
+        raw = f.read(BINARY_HEADER.size)
+    if len(raw) < BINARY_HEADER.size:
+        raise ValueError("файл слишком короткий")
+    magic, version, flags, dtype, count, h, x0 = BINARY_HEADER.unpack(raw)
+    if magic != BINARY_MAGIC:
+        raise ValueError("неизвестный формат файла")
+    if version != BINARY_VERSION:
+        raise ValueError(f"неподдерживаемая версия формата {version}")
+
+    dtype = np.dtype(dtype.rstrip(b"\0").decode())
+    info = {
+        'count': count,
+        'sorted': bool(flags & FLAG_SORTED),
+        'equispaced': bool(flags & FLAG_EQUISPACED),
+        'h': h,
+        'x0': x0,
+    }
+    if count == 0:
+        return np.empty(0, dtype), np.empty(0, dtype), info
+    expected = BINARY_HEADER_SIZE + 2 * count * dtype.itemsize
+    size = os.path.getsize(path)
+    if size < expected:
+        raise ValueError(f"файл обрезан: для {count} точек нужно {expected} байт, "
+                         f"а в файле {size}")
+    xs = np.memmap(path, dtype=dtype, mode='r',
+                   offset=BINARY_HEADER_SIZE, shape=(count,))
+    ys = np.memmap(path, dtype=dtype, mode='r',
+                   offset=BINARY_HEADER_SIZE + count * dtype.itemsize, shape=(count,))
+    return xs, ys, info
+
+
+def _load_file(data):
+    path = data['path'] if isinstance(data, dict) else data
+    if path.endswith(BINARY_SUFFIX):
+        xs, ys, info = load_binary(path)
+        if not info['sorted']:
+            order = np.argsort(xs, kind='stable')
+            xs = xs[order]
+            ys = ys[order]
+        return PointSet(xs, ys, info['equispaced'])
+    if isinstance(data, dict):
+        xs, ys = load_csv(data['path'],
+                          delimiter=data.get('delimiter', ','),
+                          header=data.get('header', False),
+                          columns=data.get('columns', (0, 1)))
+    else:
+        xs, ys = load_csv(data)
+    return PointSet(xs, ys)
+
+
+def load_points(kind, data):
+    if kind == 'file':
+        path = data['path'] if isinstance(data, dict) else data
+        st = os.stat(path)
+        options = tuple(sorted(data.items())) if isinstance(data, dict) else ()
+        return FILE_CACHE.get_or_create((path, st.st_mtime_ns, st.st_size, options),
+                                        lambda: _load_file(data))
+
+    if kind == 'func':
+        name = data['name']
+        left = data['left']
+        right = data['right']
+        count = data['n']
+        func = compile_expression(name)
+        if data.get('nodes') == 'chebyshev':
+            xs = chebyshev_nodes(left, right, count)
+        else:
             step = (right - left) / (count - 1)
-            points = [(left + i * step, func(left + i * step))
-                      for i in range(count)]
+            xs = left + np.arange(count) * step
+        return PointSet(xs, func(xs))
+
+    return PointSet.from_points(data).sorted()
+
+
+def method_error(key, points, window=0, precision='float'):
+    points = PointSet.from_points(points)
+    xs = points.xs
+    nodes = window if window and window < len(points) else len(points)
+    if (nodes > POLY_MAX_NODES and key != 'chebyshev'
+            and not issubclass(METHODS[key], PiecewiseInterpolator)):
+        return f"Слишком много узлов для метода: {nodes} > {POLY_MAX_NODES}, задайте окно"
+    if key in ('gauss', 'stirling', 'bessel') and not points.is_equispaced():
+        return "Метод требует равноотстоящих узлов"
+    if key == 'auto' and precision != 'float':
+        return "Автовыбор работает только с обычной точностью"
+    if key == 'stirling' and nodes % 2 == 0:
+        return "Для метода Стирлинга нужно нечётное число узлов"
+    if key == 'bessel' and nodes % 2 == 1:
+        return "Для метода Бесселя нужно чётное число узлов"
+    if key == 'chebyshev' and (nodes != len(points) or not is_chebyshev(xs)):
+        return "Метод Чебышёва требует узлы Чебышёва без окна"
+    if key == 'chebyshev' and precision != 'float':
+        return "Метод Чебышёва считается только с обычной точностью"
+    if issubclass(METHODS[key], PiecewiseInterpolator):
+        if len(points) < 2:
+            return "Для сплайна нужно хотя бы два узла"
+        if precision != 'float':
+            return "Сплайны считаются только с обычной точностью"
+    return None
+
+
+PROFILE_HOOKS = []
+
+STAT_COLUMNS = ("Время, мс", "Операций (оценка)", "Оценка погрешности", "Погрешность",
+                "Выбор")
+
+
+def add_profile_hook(hook):
+    PROFILE_HOOKS.append(hook)
+    return hook
+
+
+def remove_profile_hook(hook):
+    if hook in PROFILE_HOOKS:
+        PROFILE_HOOKS.remove(hook)
+
+
+def _report(stats):
+    for hook in list(PROFILE_HOOKS):
+        hook(stats)
+
+
+def format_stats(stats):
+    def num(value):
+        return "—" if value is None else f"{value:.3e}"
+    chosen = stats.get('chosen')
+    if isinstance(chosen, dict):
+        chosen = ", ".join(f"{METHOD_LABELS[k]} ×{v}" for k, v in chosen.items())
+    elif chosen is not None:
+        chosen = METHOD_LABELS[chosen]
+    return [
+        f"{1000 * (stats['fit_time'] + stats['eval_time']):.3f}",
+        str(stats['ops']),
+        num(stats['estimate']),
+        num(stats['error']),
+        chosen or "—",
+    ]
+
+
+def solve(points, methods, x_star, window=0, jobs=1, func=None,
+          precision='float', digits=PRECISION_DIGITS, check=None):
+    fp = fingerprint(points)
+    queries = int(np.size(x_star))
+    for key, method in METHODS.items():
+        if not methods.get(key):
+            continue
+        if check is not None:
+            check()
+        error = method_error(key, points, window, precision)
+        if error:
+            yield key, None, error, None
+            continue
+
+        start = time.perf_counter()
+        interp = fit(method, points, window, fp, precision, digits)
+        fitted = time.perf_counter()
+        if jobs != 1 and np.ndim(x_star):
+            value = evaluate_parallel(interp, x_star, jobs)
         else:
-            points = list(data)
+            value = interp.evaluate(x_star)
+        done = time.perf_counter()
+
+        stats = {
+            'method': key,
+            'precision': precision,
+            'nodes': len(points),
+            'queries': queries,
+            'fit_time': fitted - start,
+            'eval_time': done - fitted,
+            'ops': interp.eval_ops() * queries,
+            'estimate': None,
+            'error': None,
+            'chosen': None,
+        }
+        if isinstance(interp, AutoInterpolator):
+            if np.ndim(x_star) == 0:
+                stats['chosen'] = interp.choose(x_star)
+            else:
+                keys, counts = np.unique(interp.choices(x_star), return_counts=True)
+                stats['chosen'] = dict(zip(keys.tolist(), counts.tolist()))
+        estimate = interp.error_estimate(x_star)
+        if estimate is not None:
+            stats['estimate'] = float(estimate)
+        if func is not None:
+            stats['error'] = float(np.max(np.abs(value - func(x_star))))
+        _report(stats)
+        yield key, value, None, stats
+
+
+def batch_points(xs, ys):
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if xs.ndim != 1 or ys.ndim != 2 or ys.shape[1] != len(xs):
+        raise ValueError("Ожидаются общий массив x длины n и массив y формы (наборы, n)")
+    return PointSet(xs, ys.T)
 
-        points.sort(key=lambda p: p[0])
 
+def solve_batch(xs, ys, x_star, methods=None, window=0):
+    points = batch_points(xs, ys)
+    xx = np.atleast_1d(np.asarray(x_star, dtype=float))
+    keys = [k for k in METHODS if methods is None or methods.get(k)]
+    out = np.full((len(keys), len(ys), len(xx)), np.nan)
+    errors = {}
+    for i, key in enumerate(keys):
+        error = method_error(key, points, window)
+        if error:
+            errors[key] = error
+            continue
+        interp = _fit(METHODS[key], points, window)
+        for j, x in enumerate(xx.tolist()):
+            out[i, :, j] = interp.evaluate(x)
+    return keys, out, errors
+
+
+def process_data(kind, data, methods, x_star, gui, window=0, precision='float'):
+    try:
+        points = load_points(kind, data)
     except Exception as e:
         gui.show_error(f"Ошибка подготовки данных: {e}")
         return
@@ -213,38 +1778,192 @@ def process_data(kind, data, methods, x_star, gui):
     gui.clear_diff_table()
     gui.clear_results()
 
-    diffs = compute_diff_table(points)
-    gui.update_diff_table(diffs)
-
+    func = compile_expression(data['name']) if kind == 'func' else None
     try:
-        if methods.get('lagrange'):
-            y = interp_lagrange(points, x_star)
-            gui.add_result('Лагранж', f"{y:.6f}")
-        if methods.get('newton'):
-            y = interp_newton(points, x_star)
-            gui.add_result('Ньютон', f"{y:.6f}")
-        if methods.get('gauss'):
-            y = interp_gauss(points, x_star)
-            gui.add_result('Гаусс', f"{y:.6f}")
-        if methods.get('stirling'):
-            if len(points) % 2 == 0:
-                gui.show_error("Для метода Стирлинга нужно нечётное число узлов")
-            else:
-                y = interp_stirling(points, x_star)
-                gui.add_result('Стирлинг', f"{y:.6f}")
-        if methods.get('bessel'):
-            if len(points) % 2 == 1:
-                gui.show_error("Для метода Бесселя нужно чётное число узлов")
+        diffs = cached_diff_table(points) if len(points) <= DIFF_TABLE_MAX else ()
+        gui.update_diff_table(diffs)
+
+        for key, y, error, stats in solve(points, methods, x_star, window, func=func,
+                                          precision=precision, check=gui.check_cancelled):
+            if error:
+                gui.show_error(error)
             else:
-                y = interp_bessel(points, x_star)
-                gui.add_result('Бессель', f"{y:.6f}")
+                gui.add_result(METHOD_LABELS[key], f"{y:.6f}", format_stats(stats))
     except Exception as e:
         gui.show_error(f"Ошибка вычислений: {e}")
         return
 
     try:
-        gui.plot(points, x_star)
+        gui.plot(points, x_star, window, methods, func)
     except AttributeError:
         pass
 
     gui.show_ok("Готово")
+
+
+def read_queries(args):
+    if args.x is not None:
+        return np.array(args.x, dtype=float)
+    if args.x_file is not None:
+        return np.loadtxt(args.x_file, dtype=float, delimiter=args.delimiter,
+                          usecols=0, ndmin=1)
+    start, stop, count = args.x_range
+    return np.linspace(start, stop, int(count))
+
+
+def write_results(out, fmt, xx, results, errors, stats=None):
+    import csv
+    import json
+
+    if fmt == 'json':
+        payload = {
+            'x': xx.tolist(),
+            'results': {key: values.tolist() for key, values in results.items()},
+            'errors': errors,
+        }
+        if stats is not None:
+            payload['stats'] = stats
+        json.dump(payload, out, ensure_ascii=False)
+        out.write("\n")
+        return
+
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(['x'] + list(results))
+    columns = [xx] + list(results.values())
+    for row in zip(*(c.tolist() for c in columns)):
+        writer.writerow([repr(v) for v in row])
+
+
+def write_batch(out, fmt, xx, keys, values):
+    import csv
+    import json
+
+    if fmt == 'json':
+        payload = {
+            'x': xx.tolist(),
+            'methods': keys,
+            'values': values.tolist(),
+        }
+        json.dump(payload, out, ensure_ascii=False)
+        out.write("\n")
+        return
+
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(['method', 'channel', 'x', 'y'])
+    for key, block in zip(keys, values.tolist()):
+        for channel, row in enumerate(block, start=1):
+            for x, y in zip(xx.tolist(), row):
+                writer.writerow([key, channel, repr(x), repr(y)])
+
+
+def cli(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m solver",
+        description="Интерполяция без графического интерфейса")
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--points", help="файл с узлами (.csv, .txt или .pts)")
+    src.add_argument("--func", help="выражение f(x) для узлов, например exp(-x**2)*sin(5*x)")
+    parser.add_argument("--left", type=float, default=-3.14, help="левая граница")
+    parser.add_argument("--right", type=float, default=3.14, help="правая граница")
+    parser.add_argument("-n", type=int, default=5, help="число узлов функции")
+    parser.add_argument("--chebyshev", action="store_true",
+                        help="брать узлы функции в точках Чебышёва")
+    parser.add_argument("--delimiter", default=",", help="разделитель столбцов")
+    parser.add_argument("--header", action="store_true", help="пропустить заголовок")
+    parser.add_argument("--columns", type=int, nargs=2, default=(1, 2),
+                        metavar=("X", "Y"), help="номера столбцов x и y")
+    parser.add_argument("--channels", action="store_true",
+                        help="все столбцы файла, кроме x, — отдельные наборы узлов")
+    queries = parser.add_mutually_exclusive_group(required=True)
+    queries.add_argument("-x", type=float, action="append", help="точка x*")
+    queries.add_argument("--x-file", help="файл со значениями x* в первом столбце")
+    queries.add_argument("--x-range", type=float, nargs=3,
+                         metavar=("START", "STOP", "COUNT"), help="равномерная сетка x*")
+    parser.add_argument("--methods", default=",".join(METHODS),
+                        help="методы через запятую")
+    parser.add_argument("--window", type=int, default=0, help="размер окна k")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="число процессов (0 — по числу ядер)")
+    parser.add_argument("--precision", choices=PRECISIONS, default='float',
+                        help="арифметика построения и вычисления")
+    parser.add_argument("--digits", type=int, default=PRECISION_DIGITS,
+                        help="число значащих цифр для decimal и mpmath")
+    parser.add_argument("--format", choices=("csv", "json"), default="csv")
+    parser.add_argument("--stats", action="store_true",
+                        help="время, число операций и погрешность по методам")
+    args = parser.parse_args(argv)
+
+    keys = [k.strip() for k in args.methods.split(",") if k.strip()]
+    unknown = [k for k in keys if k not in METHODS]
+    if unknown:
+        parser.error(f"неизвестные методы: {', '.join(unknown)}")
+
+    if args.channels:
+        if not args.points:
+            parser.error("--channels работает только с --points")
+        try:
+            xs, ys = load_channels(args.points, args.delimiter, args.header,
+                                   args.columns[0] - 1)
+            xx = read_queries(args)
+            keys, values, errors = solve_batch(xs, ys, xx, dict.fromkeys(keys, True),
+                                               args.window)
+        except Exception as e:
+            print(f"Ошибка вычислений: {e}", file=sys.stderr)
+            return 1
+        for error in errors.values():
+            print(error, file=sys.stderr)
+        done = [i for i, key in enumerate(keys) if key not in errors]
+        write_batch(sys.stdout, args.format, xx, [keys[i] for i in done], values[done])
+        return 0
+
+    try:
+        if args.points:
+            points = load_points('file', {
+                'path': args.points,
+                'delimiter': args.delimiter,
+                'header': args.header,
+                'columns': (args.columns[0] - 1, args.columns[1] - 1),
+            })
+        else:
+            points = load_points('func', {
+                'name': args.func, 'left': args.left,
+                'right': args.right, 'n': args.n,
+                'nodes': 'chebyshev' if args.chebyshev else 'uniform',
+            })
+        xx = read_queries(args)
+        func = compile_expression(args.func) if args.func else None
+    except Exception as e:
+        print(f"Ошибка подготовки данных: {e}", file=sys.stderr)
+        return 1
+
+    results = {}
+    errors = []
+    stats = {}
+    try:
+        for key, values, error, info in solve(points, dict.fromkeys(keys, True), xx,
+                                                 args.window, args.jobs or None, func,
+                                                 args.precision, args.digits):
+            if error:
+                errors.append(error)
+                print(error, file=sys.stderr)
+            else:
+                results[key] = values
+                stats[key] = info
+    except Exception as e:
+        print(f"Ошибка вычислений: {e}", file=sys.stderr)
+        return 1
+
+    if args.stats:
+        for key, info in stats.items():
+            print(f"{key}: " + ", ".join(
+                f"{name} {value}" for name, value in zip(STAT_COLUMNS, format_stats(info))),
+                file=sys.stderr)
+    write_results(sys.stdout, args.format, xx, results, errors,
+                  stats if args.stats else None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import solver
+
+
+def points(n, xs=None):
+    xs = np.arange(float(n)) if xs is None else np.asarray(xs, dtype=float)
+    return list(zip(xs.tolist(), np.cos(xs / 3).tolist()))
+
+
+@pytest.mark.parametrize("x, key", [
+    (0.5, 'newton'),
+    (1.9, 'newton'),
+    (3.0, 'gauss'),
+    (4.1, 'stirling'),
+    (5.5, 'gauss'),
+    (6.5, 'newton_backward'),
+    (7.9, 'newton_backward'),
+])
+def test_choices_odd(x, key):
+    assert solver.AutoInterpolator(points(9)).choose(x) == key
+
+
+@pytest.mark.parametrize("x, key", [
+    (0.5, 'newton'),
+    (2.0, 'gauss'),
+    (3.5, 'bessel'),
+    (3.9, 'gauss'),
+    (6.5, 'newton_backward'),
+])
+def test_choices_even(x, key):
+    assert solver.AutoInterpolator(points(8)).choose(x) == key
+
+
+def test_choices_fallbacks():
+    assert solver.AutoInterpolator(points(5, [0, 1, 3, 4, 7])).choose(3.5) == 'lagrange'
+    assert solver.AutoInterpolator(points(3)).choose(1.0) == 'newton'
+
+
+def test_windowed_matches_chosen_method():
+    pts = points(30)
+    interp = solver.AutoInterpolator(pts, window=7)
+    xx = np.linspace(0.0, 29.0, 117)
+    out = interp.evaluate(xx)
+    for x, key, y in zip(xx, interp.choices(xx), out):
+        expected = solver.WindowedInterpolator(pts, solver.AutoInterpolator.methods[key], 7)
+        assert y == pytest.approx(expected.evaluate(x), rel=1e-12, abs=1e-12)
+
+
+def test_eval_ops_fits_only_used_methods():
+    interp = solver.AutoInterpolator(points(9))
+    assert interp.eval_ops() == 8
+    assert not interp.fitted
+    interp.evaluate(0.5)
+    interp.eval_ops()
+    assert set(interp.fitted) == set(interp.used) == {'newton'}
+
+
+def test_rejects_exact_precision():
+    with pytest.raises(ValueError):
+        solver.fit(solver.AutoInterpolator, points(9), precision='fraction')
+    assert solver.method_error('auto', points(9), precision='fraction')
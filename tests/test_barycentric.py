@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import solver
+
+
+def sample(n):
+    xs = np.linspace(-1.0, 1.0, n)
+    return list(zip(xs.tolist(), np.cos(2 * xs).tolist()))
+
+
+def test_add_node_matches_refit():
+    points = sample(8)
+    interp = solver.BarycentricInterpolator(points[:-1])
+    interp.add_node(*points[-1])
+    xx = np.linspace(-1.0, 1.0, 37)
+    assert np.allclose(interp.evaluate(xx), solver.BarycentricInterpolator(points).evaluate(xx))
+
+
+def test_remove_node_matches_refit():
+    points = sample(8)
+    interp = solver.BarycentricInterpolator(points)
+    interp.remove_node(3)
+    refit = solver.BarycentricInterpolator(points[:3] + points[4:])
+    xx = np.linspace(-1.0, 1.0, 37)
+    assert np.allclose(interp.evaluate(xx), refit.evaluate(xx))
+
+
+def test_add_node_rejects_existing_x():
+    interp = solver.BarycentricInterpolator(sample(4))
+    with pytest.raises(ValueError):
+        interp.add_node(interp.xs[1], 0.0)
+
+
+def test_updates_do_not_touch_cached_fit():
+    points = sample(6)
+    interp = solver.fit(solver.BarycentricInterpolator, points)
+    interp.add_node(2.0, 0.5)
+    interp.remove_node(0)
+    cached = solver.fit(solver.BarycentricInterpolator, points)
+    assert cached.xs == [x for x, _ in points]
+
+
+def test_matches_lagrange():
+    points = sample(9)
+    xx = np.linspace(-1.0, 1.0, 41)
+    assert np.allclose(solver.BarycentricInterpolator(points).evaluate(xx),
+                       solver.LagrangeInterpolator(points).evaluate(xx))
+
+
+def test_many_equispaced_nodes_do_not_underflow():
+    interp = solver.BarycentricInterpolator(sample(2000))
+    assert np.all(np.isfinite(interp.weights))
+    assert interp.evaluate(interp.xs[10]) == interp.ys[10]
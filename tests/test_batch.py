@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+import solver
+
+
+def datasets(count=4, n=9):
+    xs = np.linspace(-1.0, 1.0, n)
+    ys = np.sin(np.outer(np.linspace(1.0, 3.0, count), xs)) + np.arange(count)[:, None]
+    return xs, ys
+
+
+def test_matches_per_dataset_solves():
+    xs, ys = datasets()
+    xx = np.array([-0.83, 0.1, 0.77])
+    keys, out, errors = solver.solve_batch(xs, ys, xx)
+    assert out.shape == (len(keys), len(ys), len(xx))
+    for i, key in enumerate(keys):
+        if key in errors:
+            assert np.all(np.isnan(out[i]))
+            continue
+        for j, row in enumerate(ys):
+            points = list(zip(xs.tolist(), row.tolist()))
+            expected = solver.METHODS[key](points).evaluate(xx)
+            assert np.allclose(out[i, j], expected), key
+
+
+def test_windowed_batch_matches_per_dataset():
+    xs, ys = datasets(n=15)
+    xx = np.array([-0.95, 0.0, 0.6])
+    keys, out, _ = solver.solve_batch(xs, ys, xx, {'newton': True}, window=4)
+    for j, row in enumerate(ys):
+        interp = solver.WindowedInterpolator(solver.PointSet(xs, row),
+                                             solver.NewtonInterpolator, 4)
+        assert np.allclose(out[0, j], interp.evaluate(xx))
+
+
+def test_reports_method_errors():
+    xs, ys = datasets(n=8)
+    keys, out, errors = solver.solve_batch(xs, ys, 0.2, {'stirling': True, 'newton': True})
+    assert keys == ['newton', 'stirling']
+    assert 'stirling' in errors
+    assert np.all(np.isnan(out[1]))
+
+
+def test_does_not_modify_input():
+    xs, ys = datasets()
+    before = ys.copy()
+    solver.solve_batch(xs, ys, [0.3, -0.4])
+    assert np.array_equal(ys, before)
+
+
+def test_rejects_mismatched_shapes():
+    xs, ys = datasets()
+    with pytest.raises(ValueError):
+        solver.batch_points(xs, ys.T)
+
+
+def test_load_channels(tmp_path):
+    path = tmp_path / "channels.csv"
+    path.write_text("x,a,b\n0,1,2\n1,3,4\n2,5,6\n")
+    xs, ys = solver.load_channels(str(path), header=True)
+    assert xs.tolist() == [0.0, 1.0, 2.0]
+    assert ys.tolist() == [[1.0, 3.0, 5.0], [2.0, 4.0, 6.0]]
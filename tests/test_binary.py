@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import solver
+
+
+def test_pts_round_trip(tmp_path):
+    path = str(tmp_path / "points.pts")
+    xs = np.linspace(0.0, 3.0, 31)
+    ys = np.exp(xs)
+    solver.save_binary(path, xs, ys)
+    loaded_xs, loaded_ys, info = solver.load_binary(path)
+    assert np.array_equal(loaded_xs, xs)
+    assert np.array_equal(loaded_ys, ys)
+    assert info['count'] == 31
+    assert info['sorted'] and info['equispaced']
+    assert info['h'] == pytest.approx(0.1)
+
+
+def test_pts_unsorted_file_loads_sorted(tmp_path):
+    path = str(tmp_path / "points.pts")
+    xs = np.array([2.0, 0.0, 1.0, 5.0])
+    solver.save_binary(path, xs, xs ** 2)
+    points = solver.load_points('file', path)
+    assert not solver.load_binary(path)[2]['sorted']
+    assert points.xs.tolist() == [0.0, 1.0, 2.0, 5.0]
+    assert points.ys.tolist() == [0.0, 1.0, 4.0, 25.0]
+    assert points.is_equispaced() is False
+
+
+def test_pts_equispaced_flag_reaches_point_set(tmp_path):
+    path = str(tmp_path / "points.pts")
+    xs = np.linspace(-1.0, 1.0, 11)
+    solver.save_binary(path, xs, np.sin(xs))
+    assert solver.load_points('file', path).equispaced is True
+
+
+def test_pts_float32_round_trip(tmp_path):
+    path = str(tmp_path / "points.pts")
+    xs = np.arange(5, dtype=np.float32)
+    solver.save_binary(path, xs, 2 * xs, dtype='<f4')
+    loaded_xs, loaded_ys, _ = solver.load_binary(path)
+    assert loaded_xs.dtype == np.float32
+    assert np.array_equal(loaded_ys, 2 * xs)
+
+
+def test_truncated_pts_reports_size(tmp_path):
+    path = tmp_path / "points.pts"
+    xs = np.linspace(0.0, 1.0, 10)
+    solver.save_binary(str(path), xs, xs)
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError, match="обрезан"):
+        solver.load_binary(str(path))
+
+
+def test_pts_bad_magic(tmp_path):
+    path = tmp_path / "points.pts"
+    path.write_bytes(b"XXXX" + bytes(60))
+    with pytest.raises(ValueError, match="неизвестный формат"):
+        solver.load_binary(str(path))
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import solver
+
+
+def sample(n, func=np.exp):
+    xs = solver.chebyshev_nodes(-1.0, 2.0, n)
+    return solver.PointSet(xs, func(xs))
+
+
+@pytest.mark.parametrize("n", [2, 5, 16, 33])
+def test_matches_barycentric(n):
+    points = sample(n)
+    xx = np.linspace(-1.0, 2.0, 57)
+    assert np.allclose(solver.ChebyshevInterpolator(points).evaluate(xx),
+                       solver.BarycentricInterpolator(points).evaluate(xx))
+
+
+def test_detects_chebyshev_nodes():
+    assert solver.is_chebyshev(solver.chebyshev_nodes(0.0, 1.0, 12))
+    assert not solver.is_chebyshev(np.linspace(0.0, 1.0, 12))
+
+
+def test_method_error_requires_chebyshev_nodes():
+    xs = np.linspace(0.0, 1.0, 9)
+    assert solver.method_error('chebyshev', solver.PointSet(xs, xs))
+    assert solver.method_error('chebyshev', sample(9)) is None
+    assert solver.method_error('chebyshev', sample(9), window=4)
+
+
+def test_scalar_and_array_evaluation_agree():
+    interp = solver.ChebyshevInterpolator(sample(12, np.sin))
+    xx = np.linspace(-1.0, 2.0, 19)
+    assert np.allclose(interp.evaluate(xx), [interp.evaluate(x) for x in xx.tolist()])
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import solver
+
+
+def write(tmp_path, text):
+    path = tmp_path / "points.csv"
+    path.write_text(text)
+    return str(path)
+
+
+def test_load_csv_sorts_by_x(tmp_path):
+    xs, ys = solver.load_csv(write(tmp_path, "2,4\n0,0\n1,1\n"))
+    assert xs.tolist() == [0.0, 1.0, 2.0]
+    assert ys.tolist() == [0.0, 1.0, 4.0]
+
+
+def test_bad_value_reports_line_number(tmp_path):
+    path = write(tmp_path, "0,0\n1,1\n2,oops\n3,9\n")
+    with pytest.raises(ValueError, match="строка 3"):
+        solver.load_csv(path)
+
+
+def test_line_number_counts_header(tmp_path):
+    path = write(tmp_path, "x,y\n0,0\n1,x\n")
+    with pytest.raises(ValueError, match="строка 3"):
+        solver.load_csv(path, header=True)
+
+
+def test_line_number_across_chunks(tmp_path):
+    rows = [f"{i},{i * i}" for i in range(10)]
+    rows[7] = "7,?"
+    path = write(tmp_path, "\n".join(rows) + "\n")
+    with pytest.raises(ValueError, match="строка 8"):
+        solver.load_csv(path, chunk_rows=3)
+
+
+def test_columns_and_delimiter(tmp_path):
+    path = write(tmp_path, "a;1;10\nb;2;20\n")
+    xs, ys = solver.load_csv(path, delimiter=';', columns=(1, 2))
+    assert np.array_equal(xs, [1.0, 2.0])
+    assert np.array_equal(ys, [10.0, 20.0])
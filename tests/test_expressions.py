@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+import solver
+
+
+@pytest.mark.parametrize("text", [
+    "x.real",
+    "sin.__class__",
+    "__import__('os')",
+    "(lambda: 1)()",
+    "[x for x in ()]",
+    "open('f')",
+    "eval('1')",
+    "x(2)",
+    "pi(x)",
+    "sin(x=1)",
+    "'a'",
+    "True",
+    "x if x else 1",
+])
+def test_rejects_unsafe_or_unknown_constructs(text):
+    with pytest.raises(ValueError):
+        solver.compile_expression(text)
+
+
+def test_syntax_error_is_value_error():
+    with pytest.raises(ValueError, match="ошибка в выражении"):
+        solver.compile_expression("sin(x")
+
+
+def test_caret_is_power():
+    func = solver.compile_expression("x^2 + 2^3")
+    assert func(3.0) == 17.0
+
+
+def test_whitelisted_functions_and_constants():
+    func = solver.compile_expression("sqrt(abs(x)) * cos(pi * x) + ln(e)")
+    xx = np.array([-4.0, 0.0, 1.0])
+    assert np.allclose(func(xx), np.sqrt(np.abs(xx)) * np.cos(np.pi * xx) + 1.0)
+
+
+def test_integer_constants_use_true_division():
+    assert solver.compile_expression("1/2")(0.0) == 0.5
+
+
+def test_constant_expression_broadcasts_to_x():
+    xx = np.zeros((3, 2))
+    result = solver.compile_expression("2")(xx)
+    assert result.shape == (3, 2)
+    assert np.all(result == 2.0)
+
+
+def test_result_is_writable_copy():
+    result = solver.compile_expression("1")(np.zeros(4))
+    result[0] = 5.0
+    assert result.tolist() == [5.0, 1.0, 1.0, 1.0]
+
+
+def test_compiled_functions_are_cached_by_text():
+    solver.EXPRESSION_CACHE.clear()
+    first = solver.compile_expression("exp(-x^2)")
+    assert solver.compile_expression("  exp(-x^2) ") is first
+    assert solver.compile_expression("exp(-x**2)") is not first
+    assert first.expression == "exp(-x^2)"
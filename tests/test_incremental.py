@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+import solver
+
+
+def sample(n):
+    xs = np.linspace(0.0, 2.0, n)
+    return list(zip(xs.tolist(), np.exp(xs).tolist()))
+
+
+def test_appends_match_full_refit():
+    points = sample(9)
+    stream = solver.IncrementalNewtonInterpolator()
+    for count, (x, y) in enumerate(points, 1):
+        stream.append(x, y)
+        refit = solver.NewtonInterpolator(points[:count])
+        assert np.allclose(stream.coeffs, refit.coeffs)
+    xx = np.linspace(0.0, 2.0, 31)
+    assert np.allclose(stream.evaluate(xx), solver.NewtonInterpolator(points).evaluate(xx))
+
+
+def test_append_keeps_earlier_coefficients():
+    points = sample(6)
+    stream = solver.IncrementalNewtonInterpolator(points[:5])
+    before = list(stream.coeffs)
+    stream.append(*points[5])
+    assert stream.coeffs[:5] == before
+
+
+def test_fin_diagonal_matches_forward_table_for_ascending_points():
+    points = sample(7)
+    stream = solver.IncrementalNewtonInterpolator()
+    for n, (x, y) in enumerate(points):
+        diagonal = stream.append(x, y)
+        table = solver.compute_diff_table(points[:n + 1])
+        assert np.allclose(diagonal, [table.entry(k, n - k) for k in range(n + 1)])
+
+
+def test_append_rejects_existing_x():
+    stream = solver.IncrementalNewtonInterpolator(sample(3))
+    with pytest.raises(ValueError):
+        stream.append(stream.xs[1], 0.0)
+
+
+def test_snapshot_is_independent():
+    points = sample(5)
+    stream = solver.IncrementalNewtonInterpolator(points[:4])
+    snapshot = stream.snapshot()
+    stream.append(*points[4])
+    assert len(snapshot.xs) == len(snapshot.coeffs) == 4
+    expected = solver.NewtonInterpolator(points[:4]).evaluate(0.3)
+    assert snapshot.evaluate(0.3) == pytest.approx(expected)
@@ -0,0 +1,76 @@
+import importlib.util
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import solver
+
+EXACT = ['fraction', 'decimal',
+         pytest.param('mpmath', marks=pytest.mark.skipif(
+             not importlib.util.find_spec('mpmath'), reason="нет mpmath"))]
+
+
+def sample(n):
+    xs = np.linspace(-1.0, 1.0, n)
+    return solver.PointSet(xs, np.exp(xs) * np.sin(3 * xs))
+
+
+def exact_lagrange(points, x):
+    x = Fraction(x)
+    nodes = [(Fraction(xi), Fraction(yi)) for xi, yi in points]
+    total = Fraction(0)
+    for i, (xi, yi) in enumerate(nodes):
+        term = yi
+        for j, (xj, _) in enumerate(nodes):
+            if i != j:
+                term *= (x - xj) / (xi - xj)
+        total += term
+    return total
+
+
+@pytest.mark.parametrize("precision", EXACT)
+@pytest.mark.parametrize("key, n", [('lagrange', 9), ('newton', 9), ('gauss', 9),
+                                    ('stirling', 9), ('bessel', 8)])
+def test_matches_float(precision, key, n):
+    points = sample(n)
+    xx = np.linspace(-0.9, 0.9, 7)
+    exact = solver.fit(solver.METHODS[key], points, precision=precision)
+    approx = solver.fit(solver.METHODS[key], points)
+    assert np.allclose(exact.evaluate(xx), approx.evaluate(xx), rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("key", ['lagrange', 'newton'])
+def test_fraction_is_correctly_rounded(key):
+    points = sample(12)
+    interp = solver.fit(solver.METHODS[key], points, precision='fraction')
+    for x in (-0.77, 0.013, 0.5):
+        assert interp.evaluate(x) == float(exact_lagrange(points, x))
+
+
+def test_decimal_digits_are_respected():
+    points = sample(10)
+    coarse = solver.fit(solver.NewtonInterpolator, points, precision='decimal', digits=6)
+    fine = solver.fit(solver.NewtonInterpolator, points, precision='decimal', digits=60)
+    exact = float(exact_lagrange(points, 0.3))
+    assert fine.evaluate(0.3) == exact
+    assert coarse.evaluate(0.3) != exact
+    assert coarse.evaluate(0.3) == pytest.approx(exact, rel=1e-4)
+
+
+def test_windowed_exact_fit():
+    points = sample(15)
+    exact = solver.fit(solver.NewtonInterpolator, points, window=4, precision='fraction')
+    approx = solver.fit(solver.NewtonInterpolator, points, window=4)
+    xx = np.linspace(-1.0, 1.0, 21)
+    assert np.allclose(exact.evaluate(xx), approx.evaluate(xx))
+
+
+@pytest.mark.parametrize("key", ['chebyshev', 'spline', 'akima', 'auto'])
+def test_float_only_methods_are_rejected(key):
+    assert solver.method_error(key, sample(9), precision='fraction')
+
+
+def test_unknown_precision():
+    with pytest.raises(ValueError):
+        solver.PreciseInterpolator(sample(3), solver.NewtonInterpolator, precision='quad')
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+import solver
+
+SPLINES = (solver.CubicSplineInterpolator, solver.ClampedSplineInterpolator,
+           solver.NotAKnotSplineInterpolator)
+
+
+def sample(n=9, func=np.sin):
+    xs = np.sort(np.random.default_rng(n).uniform(-2.0, 2.0, n))
+    return solver.PointSet(xs, func(xs))
+
+
+def segment_ends(spline):
+    h = np.diff(spline.nodes)
+    a, b, c, d = spline.coeffs
+    value = a + h * (b + h * (c + h * d))
+    slope = b + h * (2 * c + 3 * h * d)
+    curvature = 2 * c + 6 * h * d
+    return value, slope, curvature
+
+
+@pytest.mark.parametrize("method", SPLINES)
+def test_spline_interpolates_nodes(method):
+    points = sample()
+    spline = method(points)
+    assert np.allclose(spline.evaluate(points.xs), points.ys)
+
+
+@pytest.mark.parametrize("method", SPLINES)
+def test_spline_is_c2(method):
+    spline = method(sample())
+    value, slope, curvature = segment_ends(spline)
+    a, b, c, d = spline.coeffs
+    assert np.allclose(value[:-1], a[1:])
+    assert np.allclose(slope[:-1], b[1:])
+    assert np.allclose(curvature[:-1], 2 * c[1:])
+
+
+def test_natural_spline_has_zero_end_curvature():
+    spline = solver.CubicSplineInterpolator(sample())
+    _, _, curvature = segment_ends(spline)
+    assert spline.coeffs[2, 0] == pytest.approx(0.0, abs=1e-12)
+    assert curvature[-1] == pytest.approx(0.0, abs=1e-10)
+
+
+def test_clamped_spline_matches_end_slopes():
+    spline = solver.CubicSplineInterpolator(sample(), 'clamped', end_slopes=(0.5, -1.5))
+    _, slope, _ = segment_ends(spline)
+    assert spline.coeffs[1, 0] == pytest.approx(0.5)
+    assert slope[-1] == pytest.approx(-1.5)
+
+
+def test_not_a_knot_spline_has_continuous_third_derivative():
+    d = solver.NotAKnotSplineInterpolator(sample()).coeffs[3]
+    assert d[0] == pytest.approx(d[1])
+    assert d[-2] == pytest.approx(d[-1])
+
+
+@pytest.mark.parametrize("boundary", ['clamped', 'not-a-knot'])
+def test_spline_reproduces_cubic(boundary):
+    cubic = np.polynomial.Polynomial([1.0, -2.0, 0.5, 0.25])
+    points = sample(func=cubic)
+    slopes = (cubic.deriv()(points.xs[0]), cubic.deriv()(points.xs[-1]))
+    spline = solver.CubicSplineInterpolator(
+        points, boundary, slopes if boundary == 'clamped' else None)
+    xx = np.linspace(points.xs[0], points.xs[-1], 101)
+    assert np.allclose(spline.evaluate(xx), cubic(xx))
+
+
+def test_akima_reproduces_line():
+    points = sample(func=lambda x: 3 * x - 1)
+    xx = np.linspace(points.xs[0], points.xs[-1], 101)
+    assert np.allclose(solver.AkimaInterpolator(points).evaluate(xx), 3 * xx - 1)
+
+
+def test_scalar_and_array_evaluation_agree():
+    spline = solver.CubicSplineInterpolator(sample())
+    xx = np.linspace(-2.5, 2.5, 23)
+    assert np.allclose(spline.evaluate(xx), [spline.evaluate(x) for x in xx.tolist()])
+
+
+def test_spline_rejects_duplicate_nodes():
+    with pytest.raises(ValueError):
+        solver.CubicSplineInterpolator([(0.0, 1.0), (0.0, 2.0), (1.0, 3.0)])
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import solver
+
+NODES = np.arange(10.0)
+
+
+@pytest.mark.parametrize("k, x, start", [
+    (3, -5.0, 0),
+    (3, 0.0, 0),
+    (3, 4.4, 3),
+    (3, 4.5, 3),
+    (3, 4.6, 4),
+    (3, 9.0, 7),
+    (3, 50.0, 7),
+    (4, -5.0, 0),
+    (4, 4.0, 3),
+    (4, 4.5, 3),
+    (4, 8.5, 6),
+    (4, 50.0, 6),
+    (10, 4.5, 0),
+])
+def test_window_starts(k, x, start):
+    assert solver.window_starts(NODES, k, np.array([x]))[0] == start
+
+
+@pytest.mark.parametrize("k", [2, 3, 4, 5])
+def test_window_contains_query(k):
+    xx = np.linspace(0.0, 9.0, 91)
+    starts = solver.window_starts(NODES, k, xx)
+    assert np.all(starts >= 0) and np.all(starts <= len(NODES) - k)
+    assert np.all(NODES[starts] <= xx) and np.all(xx <= NODES[starts + k - 1])
+
+
+def test_odd_window_is_centred_on_nearest_node():
+    xx = np.linspace(2.0, 7.0, 51)
+    starts = solver.window_starts(NODES, 5, xx)
+    assert np.all(np.abs(NODES[starts + 2] - xx) <= 0.5 + 1e-12)
+
+
+@pytest.mark.parametrize("k", [3, 4])
+def test_matches_fit_on_window(k):
+    points = solver.PointSet(NODES, np.sin(NODES))
+    interp = solver.WindowedInterpolator(points, solver.NewtonInterpolator, k)
+    for x in (0.2, 3.7, 8.9):
+        start = int(solver.window_starts(NODES, k, np.array([x]))[0])
+        local = solver.NewtonInterpolator(points[start:start + k])
+        assert interp.evaluate(x) == pytest.approx(local.evaluate(x))
+
+
+def test_scalar_and_array_evaluation_agree():
+    points = solver.PointSet(NODES, np.cos(NODES))
+    interp = solver.WindowedInterpolator(points, solver.BarycentricInterpolator, 4)
+    xx = np.linspace(-1.0, 10.0, 45)
+    assert np.allclose(interp.evaluate(xx), [interp.evaluate(x) for x in xx.tolist()])
+
+
+def test_rejects_bad_window_size():
+    with pytest.raises(ValueError):
+        solver.WindowedInterpolator(solver.PointSet(NODES, NODES), solver.NewtonInterpolator, 11)
+
+
+def test_window_fits_are_cached():
+    interp = solver.WindowedInterpolator(solver.PointSet(NODES, NODES ** 2),
+                                         solver.NewtonInterpolator, 3)
+    interp.evaluate(np.linspace(0.0, 9.0, 100))
+    assert len(interp.cache) == len(NODES) - 2